@@ -2,19 +2,22 @@
 """Main CLI for research paper aggregator."""
 
 import argparse
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Tuple
 
 from src.config import Config
-from src.fetchers.arxiv_fetcher import ArXivFetcher
 from src.fetchers.base_fetcher import Paper
-from src.fetchers.crossref_fetcher import CrossRefFetcher
-from src.fetchers.rss_fetcher import RSSFetcher
 from src.filter import PaperFilter
-from src.llm_scorer import LLMPaperScorer
 from src.report_generator import MarkdownReportGenerator
 
+# Fetchers and the LLM scorer are imported where they are used, since their
+# third-party dependencies (arxiv, feedparser, requests, openai) are slow to
+# import and often not needed for a given run
+
 
 def main():
     """Main entry point for the research paper aggregator."""
@@ -82,6 +85,11 @@ def main():
 
     args = parser.parse_args()
 
+    # Fetcher progress is logged; show it as plain lines alongside the prints
+    # below, while third-party libraries (e.g. arxiv) stay at warning level
+    logging.basicConfig(level=logging.WARNING, format="%(message)s", stream=sys.stdout)
+    logging.getLogger("src").setLevel(logging.INFO)
+
     # Load configuration
     try:
         config = Config(args.config, args.sources_config, args.llm_config)
@@ -124,60 +132,78 @@ def main():
     print("=" * 80)
 
     # Step 1: Fetch papers from selected sources
-    all_papers: List[Paper] = []
+    # Each source is I/O bound, so all selected sources are fetched concurrently.
+    # The cutoff is computed once so every source filters against the same date.
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    fetch_tasks: List[Tuple[str, Callable[[], List[Paper]]]] = []
 
     if args.source in ["all", "arxiv"]:
-        print("\n[Fetching from ArXiv...]")
-        try:
-            arxiv_fetcher = ArXivFetcher(
+        from src.fetchers.arxiv_fetcher import ArXivFetcher
+
+        fetch_tasks.append((
+            "ArXiv",
+            lambda: ArXivFetcher(
                 categories=config.arxiv_categories,
                 max_results=config.max_results,
-            )
-            arxiv_papers = arxiv_fetcher.fetch_papers(days=days)
-            all_papers.extend(arxiv_papers)
-            print(f"✓ ArXiv: {len(arxiv_papers)} papers")
-        except Exception as e:
-            print(f"✗ ArXiv error: {e}")
+            ).fetch_papers(days=days, cutoff=cutoff),
+        ))
+
+    if args.source in ["all", "sage", "nature", "other"]:
+        from src.fetchers.rss_fetcher import RSSFetcher
 
     if args.source in ["all", "sage"]:
-        print("\n[Fetching from SAGE Journals...]")
-        try:
-            sage_fetcher = RSSFetcher(config.sage_journals, "SAGE")
-            sage_papers = sage_fetcher.fetch_papers(days=days, specific_journal=args.journal)
-            all_papers.extend(sage_papers)
-            print(f"✓ SAGE: {len(sage_papers)} papers")
-        except Exception as e:
-            print(f"✗ SAGE error: {e}")
+        fetch_tasks.append((
+            "SAGE",
+            lambda: RSSFetcher(config.sage_journals, "SAGE").fetch_papers(
+                days=days, specific_journal=args.journal, cutoff=cutoff
+            ),
+        ))
 
     if args.source in ["all", "nature"]:
-        print("\n[Fetching from Nature Journals...]")
-        try:
-            nature_fetcher = RSSFetcher(config.nature_journals, "Nature")
-            nature_papers = nature_fetcher.fetch_papers(days=days, specific_journal=args.journal)
-            all_papers.extend(nature_papers)
-            print(f"✓ Nature: {len(nature_papers)} papers")
-        except Exception as e:
-            print(f"✗ Nature error: {e}")
+        fetch_tasks.append((
+            "Nature",
+            lambda: RSSFetcher(config.nature_journals, "Nature").fetch_papers(
+                days=days, specific_journal=args.journal, cutoff=cutoff
+            ),
+        ))
 
     if args.source in ["all", "other"]:
-        print("\n[Fetching from Other Journals...]")
-        try:
-            other_fetcher = RSSFetcher(config.other_journals, "Other")
-            other_papers = other_fetcher.fetch_papers(days=days, specific_journal=args.journal)
-            all_papers.extend(other_papers)
-            print(f"✓ Other journals: {len(other_papers)} papers")
-        except Exception as e:
-            print(f"✗ Other journals error: {e}")
+        fetch_tasks.append((
+            "Other journals",
+            lambda: RSSFetcher(config.other_journals, "Other").fetch_papers(
+                days=days, specific_journal=args.journal, cutoff=cutoff
+            ),
+        ))
 
     if args.source in ["all", "crossref"]:
-        print("\n[Fetching from CrossRef API...]")
-        try:
-            crossref_fetcher = CrossRefFetcher(config.crossref_journals)
-            crossref_papers = crossref_fetcher.fetch_papers(days=days, specific_journal=args.journal)
-            all_papers.extend(crossref_papers)
-            print(f"✓ CrossRef: {len(crossref_papers)} papers")
-        except Exception as e:
-            print(f"✗ CrossRef error: {e}")
+        from src.fetchers.crossref_fetcher import CrossRefFetcher
+
+        fetch_tasks.append((
+            "CrossRef",
+            lambda: CrossRefFetcher(config.crossref_journals).fetch_papers(
+                days=days, specific_journal=args.journal, cutoff=cutoff
+            ),
+        ))
+
+    print(f"\n[Fetching from {', '.join(label for label, _ in fetch_tasks)}...]")
+    all_papers: List[Paper] = []
+    source_results: List[str] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, len(fetch_tasks))) as executor:
+        futures = [(label, executor.submit(fetch)) for label, fetch in fetch_tasks]
+
+        # Collect in submission order so the combined paper list is deterministic
+        for label, future in futures:
+            try:
+                papers = future.result()
+                all_papers.extend(papers)
+                source_results.append(f"✓ {label}: {len(papers)} papers")
+            except Exception as e:
+                source_results.append(f"✗ {label} error: {e}")
+
+    print()
+    for line in source_results:
+        print(line)
 
     print(f"\n{'='*80}")
     print(f"Total papers fetched: {len(all_papers)}")
@@ -189,6 +215,8 @@ def main():
 
     # Step 2: Filter and score papers
     if args.use_llm:
+        from src.llm_scorer import LLMPaperScorer
+
         provider = config.llm_provider
         if provider == "dashscope":
             print(f"\n[Scoring papers with LLM ({config.dashscope_model} via DashScope)...]")
@@ -197,6 +225,8 @@ def main():
                 model=config.dashscope_model,
                 research_interests=config.research_interests,
                 provider="dashscope",
+                embedding_model=config.dashscope_embedding_model,
+                prefilter_top_k=config.llm_prefilter_top_k,
             )
         else:  # azure
             print(f"\n[Scoring papers with LLM ({config.azure_deployment} via Azure)...]")
@@ -205,19 +235,23 @@ def main():
                 model=f"{config.azure_endpoint}|{config.azure_deployment}",
                 research_interests=config.research_interests,
                 provider="azure",
+                use_batch_api=config.azure_use_batch_api,
+                embedding_model=config.azure_embedding_deployment or None,
+                prefilter_top_k=config.llm_prefilter_top_k,
             )
 
         min_score = args.min_score if args.min_score > 1 else config.llm_min_score
-        filtered_papers = llm_scorer.score_papers_batch(all_papers, min_score=min_score)
+        # Scoring already groups papers by LLM relevance
+        grouped_papers = llm_scorer.score_papers_grouped(all_papers, min_score=min_score)
+        filtered_papers = grouped_papers["high"] + grouped_papers["medium"] + grouped_papers["low"]
         print(f"✓ Found {len(filtered_papers)} relevant papers")
 
         if not filtered_papers:
             print("\nNo papers matched the LLM relevance criteria.")
             sys.exit(0)
 
-        # Step 3: Group papers by LLM relevance
+        # Step 3: Report papers by LLM relevance
         print("\n[Grouping papers by LLM relevance...]")
-        grouped_papers = llm_scorer.group_papers_by_relevance(filtered_papers)
         print(f"✓ High relevance (≥75): {len(grouped_papers['high'])} papers")
         print(f"✓ Medium relevance (50-74): {len(grouped_papers['medium'])} papers")
         print(f"✓ Low relevance (<50): {len(grouped_papers['low'])} papers")
@@ -247,8 +281,8 @@ def main():
     generator = MarkdownReportGenerator(output_dir=args.output_dir)
 
     try:
-        # Collect all source names
-        sources = set(paper.source for paper in filtered_papers)
+        # Collect all source names (a handful of shared strings, so this is cheap)
+        sources = {paper.source for paper in filtered_papers}
 
         if args.summary:
             report_path = generator.generate_summary_report(
@@ -1,10 +1,45 @@
 """Configuration management for the research paper aggregator."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file, reusing the result while the file is unchanged.
+
+    Args:
+        path_str: Path to the YAML file
+        mtime_ns: Modification time of the file, used to invalidate the cache
+
+    Returns:
+        Parsed YAML content, shared by all callers; do not mutate
+    """
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _read_yaml(path: Path) -> Any:
+    """Read a YAML file through the parse cache.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content, as a copy the caller is free to mutate
+    """
+    return copy.deepcopy(_load_yaml(str(path.resolve()), path.stat().st_mtime_ns))
+
 
 class Config:
     """Manages configuration loading from YAML files."""
@@ -13,18 +48,18 @@ class Config:
         self,
         config_path: Union[str, Path] = "config/keywords.yaml",
         sources_path: Union[str, Path] = "config/sources.yaml",
-        llm_path: Union[str, Path] = "config/llm.yaml",
+        llm_path: Optional[Union[str, Path]] = "config/llm.yaml",
     ):
         """Initialize configuration from files.
 
         Args:
             config_path: Path to the keywords configuration YAML file
             sources_path: Path to the sources configuration YAML file
-            llm_path: Path to the LLM configuration YAML file
+            llm_path: Path to the LLM configuration YAML file (None to skip LLM settings)
         """
         self.config_path = Path(config_path)
         self.sources_path = Path(sources_path)
-        self.llm_path = Path(llm_path)
+        self.llm_path = Path(llm_path) if llm_path is not None else None
         self._config: Dict[str, Any] = {}
         self._sources: Dict[str, Any] = {}
         self._llm: Dict[str, Any] = {}
@@ -35,114 +70,69 @@ class Config:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path) as f:
-            self._config = yaml.safe_load(f)
+        self._config = _read_yaml(self.config_path)
 
         # Load sources configuration if it exists
         if self.sources_path.exists():
-            with open(self.sources_path) as f:
-                self._sources = yaml.safe_load(f)
+            self._sources = _read_yaml(self.sources_path)
         else:
             self._sources = {}
 
         # Load LLM configuration if it exists
-        if self.llm_path.exists():
-            with open(self.llm_path) as f:
-                self._llm = yaml.safe_load(f)
+        if self.llm_path is not None and self.llm_path.exists():
+            self._llm = _read_yaml(self.llm_path)
         else:
             self._llm = {}
 
-    @property
-    def arxiv_categories(self) -> List[str]:
-        """Get ArXiv categories to search."""
-        return self._config.get("arxiv", {}).get("categories", [])
-
-    @property
-    def primary_keywords(self) -> List[str]:
-        """Get primary keywords for filtering."""
-        return self._config.get("keywords", {}).get("primary", [])
-
-    @property
-    def secondary_keywords(self) -> List[str]:
-        """Get secondary keywords for filtering."""
-        return self._config.get("keywords", {}).get("secondary", [])
-
-    @property
-    def all_keywords(self) -> List[str]:
-        """Get all keywords combined."""
-        return self.primary_keywords + self.secondary_keywords
-
-    @property
-    def default_days(self) -> int:
-        """Get default number of days to look back."""
-        return self._config.get("search", {}).get("default_days", 7)
-
-    @property
-    def max_results(self) -> int:
-        """Get maximum results per category."""
-        return self._config.get("search", {}).get("max_results", 100)
-
-    @property
-    def sage_journals(self) -> Dict[str, Dict[str, str]]:
-        """Get SAGE journal configurations."""
-        return self._sources.get("sage_journals", {})
-
-    @property
-    def nature_journals(self) -> Dict[str, Dict[str, str]]:
-        """Get Nature journal configurations."""
-        return self._sources.get("nature_journals", {})
-
-    @property
-    def other_journals(self) -> Dict[str, Dict[str, str]]:
-        """Get other journal configurations (PNAS, Science, etc.)."""
-        return self._sources.get("other_journals", {})
-
-    @property
-    def crossref_journals(self) -> Dict[str, Dict[str, str]]:
-        """Get CrossRef journal configurations."""
-        return self._sources.get("crossref_journals", {})
-
-    @property
-    def llm_config(self) -> Dict[str, Any]:
-        """Get LLM configuration."""
-        return self._llm
-
-    @property
-    def azure_endpoint(self) -> str:
-        """Get Azure OpenAI endpoint."""
-        return self._llm.get("azure_openai", {}).get("endpoint", "")
-
-    @property
-    def azure_api_key(self) -> str:
-        """Get Azure OpenAI API key."""
-        return self._llm.get("azure_openai", {}).get("api_key", "")
-
-    @property
-    def azure_deployment(self) -> str:
-        """Get Azure OpenAI deployment name."""
-        return self._llm.get("azure_openai", {}).get("deployment", "gpt-4o-mini")
-
-    @property
-    def research_interests(self) -> str:
-        """Get research interests for LLM."""
-        return self._llm.get("research_interests", "")
-
-    @property
-    def llm_min_score(self) -> int:
-        """Get LLM minimum score."""
-        return self._llm.get("scoring", {}).get("min_score", 50)
-
-    @property
-    def llm_provider(self) -> str:
-        """Get LLM provider (dashscope or azure)."""
-        return self._llm.get("provider", "dashscope")
-
-    @property
-    def dashscope_api_key(self) -> str:
-        """Get DashScope API key."""
-        return self._llm.get("dashscope", {}).get("api_key", "")
-
-    @property
-    def dashscope_model(self) -> str:
-        """Get DashScope model name."""
-        return self._llm.get("dashscope", {}).get("model", "qwen-plus")
+        self.preload()
+
+    def preload(self) -> None:
+        """Resolve all settings from the loaded YAML into plain attributes.
+
+        Runs once per load, so reading a setting is a single attribute lookup.
+        Keyword and category lists are stored as tuples so callers cannot
+        mutate shared configuration.
+        """
+        arxiv = self._config.get("arxiv", {})
+        keywords = self._config.get("keywords", {})
+        search = self._config.get("search", {})
+
+        # ArXiv categories to search
+        self.arxiv_categories: Tuple[str, ...] = tuple(arxiv.get("categories", []))
+
+        # Keywords for filtering (primary are weighted higher)
+        self.primary_keywords: Tuple[str, ...] = tuple(keywords.get("primary", []))
+        self.secondary_keywords: Tuple[str, ...] = tuple(keywords.get("secondary", []))
+        self.all_keywords: Tuple[str, ...] = self.primary_keywords + self.secondary_keywords
+
+        # Search defaults: days to look back and maximum results per category
+        self.default_days: int = search.get("default_days", 7)
+        self.max_results: int = search.get("max_results", 100)
+
+        # Journal configurations by source group
+        self.sage_journals: Dict[str, Dict[str, str]] = self._sources.get("sage_journals", {})
+        self.nature_journals: Dict[str, Dict[str, str]] = self._sources.get("nature_journals", {})
+        self.other_journals: Dict[str, Dict[str, str]] = self._sources.get("other_journals", {})
+        self.crossref_journals: Dict[str, Dict[str, str]] = self._sources.get(
+            "crossref_journals", {}
+        )
+
+        # LLM configuration
+        azure = self._llm.get("azure_openai", {})
+        dashscope = self._llm.get("dashscope", {})
+
+        self.llm_config: Dict[str, Any] = self._llm
+        self.llm_provider: str = self._llm.get("provider", "dashscope")
+        self.research_interests: str = self._llm.get("research_interests", "")
+        self.llm_min_score: int = self._llm.get("scoring", {}).get("min_score", 50)
+        self.llm_prefilter_top_k: int = self._llm.get("scoring", {}).get("prefilter_top_k", 0)
+        self.azure_endpoint: str = azure.get("endpoint", "")
+        self.azure_api_key: str = azure.get("api_key", "")
+        self.azure_deployment: str = azure.get("deployment", "gpt-4o-mini")
+        self.azure_use_batch_api: bool = azure.get("use_batch_api", False)
+        self.azure_embedding_deployment: str = azure.get("embedding_deployment", "")
+        self.dashscope_api_key: str = dashscope.get("api_key", "")
+        self.dashscope_model: str = dashscope.get("model", "qwen-plus")
+        self.dashscope_embedding_model: str = dashscope.get(
+            "embedding_model", "text-embedding-v3"
+        )
@@ -1,104 +1,384 @@
 """ArXiv paper fetcher with filtering capabilities."""
 
+import gzip
+import hashlib
+import heapq
+import logging
+import operator
+import os
+import pickle
+import threading
 import time
-from datetime import datetime, timedelta, timezone
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import takewhile
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Union
 
 import arxiv
 
 from src.fetchers.base_fetcher import BaseFetcher, Paper
 
+logger = logging.getLogger(__name__)
+
+
+class _RequestSlot:
+    """Serializes ArXiv requests and spaces their start times.
+
+    Waiting is measured from the start of the previous request, so a slow
+    response already counts towards the delay and nothing sleeps after the
+    final request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    @contextmanager
+    def hold(self, min_interval: float) -> Iterator[None]:
+        """Wait for the next free slot and hold it for the duration of a request.
+
+        Args:
+            min_interval: Minimum seconds between the starts of two requests
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_request_at:
+                time.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + min_interval
+            yield
+
+
+# ArXiv asks for at most one request every three seconds, so all category
+# workers share a single request slot.
+_REQUEST_SLOT = _RequestSlot()
+
+# C-level accessor for author names; some listings have thousands of authors
+_author_name = operator.attrgetter("name")
+_published = operator.attrgetter("published")
+
+# Longer category queries are split so request URLs stay well below the
+# length at which servers start answering 414 URI Too Long.
+MAX_QUERY_LENGTH = 1000
+
+
+def _category_query(categories: List[str]) -> str:
+    """Build a query matching papers in any of the given categories.
+
+    Args:
+        categories: List of ArXiv category codes
+
+    Returns:
+        ArXiv search query
+    """
+    return " OR ".join(f"cat:{category}" for category in categories)
+
+
+def _batch_categories(categories: List[str], max_query_length: int) -> List[List[str]]:
+    """Group categories into batches whose combined query fits the length limit.
+
+    Args:
+        categories: List of ArXiv category codes
+        max_query_length: Maximum length of a batched query
+
+    Returns:
+        List of category batches
+    """
+    batches: List[List[str]] = []
+    current: List[str] = []
+
+    for category in categories:
+        if current and len(_category_query(current + [category])) > max_query_length:
+            batches.append(current)
+            current = []
+        current.append(category)
+
+    if current:
+        batches.append(current)
+
+    return batches
+
 
 class ArXivFetcher(BaseFetcher):
     """Fetches papers from ArXiv API with rate limiting and error handling."""
 
-    def __init__(self, categories: List[str], max_results: int = 100):
+    def __init__(
+        self,
+        categories: List[str],
+        max_results: int = 100,
+        max_workers: int = 4,
+        cache_dir: Optional[Union[str, Path]] = ".cache/arxiv",
+        cache_ttl: float = 3600.0,
+    ):
         """Initialize fetcher.
 
         Args:
             categories: List of ArXiv category codes (e.g., 'cs.CY')
             max_results: Maximum results to fetch per category
+            max_workers: Maximum number of category batches fetched concurrently
+            cache_dir: Directory to cache fetched results (None disables caching)
+            cache_ttl: Seconds a cached result stays fresh
         """
         super().__init__("ArXiv")
         self.categories = categories
         self.max_results = max_results
-        self.client = arxiv.Client()
+        self.max_workers = max_workers
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
+        # The client keeps one requests.Session, so connections are reused.
+        # Pages are fetched lazily, one page at a time, as results are consumed.
+        self.client = arxiv.Client(page_size=100, delay_seconds=3.0, num_retries=3)
+
+        # Categories are OR-ed into as few queries as possible, and since the
+        # queries never change each search is built once
+        self._batches = _batch_categories(categories, MAX_QUERY_LENGTH)
+        self._batch_searches: List[arxiv.Search] = [
+            self._build_search(_category_query(batch), max_results * len(batch))
+            for batch in self._batches
+        ]
+
+    def _build_search(self, query: str, max_results: int) -> arxiv.Search:
+        """Build a search sorted by submission date (newest first).
+
+        Args:
+            query: ArXiv search query
+            max_results: Maximum results
+
+        Returns:
+            ArXiv search object
+        """
+        return arxiv.Search(
+            query=query,
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending,
+        )
 
     def fetch_papers(
         self,
         days: int = 7,
         rate_limit_delay: float = 3.0,
+        *,
+        cutoff: Optional[datetime] = None,
     ) -> List[Paper]:
         """Fetch papers from ArXiv within date range.
 
+        Categories are combined into batched OR queries, usually a single
+        request. Batches are fetched concurrently, but every worker shares a
+        single request slot so the global request rate stays within ArXiv's
+        limits.
+
         Args:
             days: Number of days to look back
             rate_limit_delay: Delay between requests in seconds
+            cutoff: Only include papers published after this date (overrides days)
 
         Returns:
             List of Paper objects
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff_date = self._resolve_cutoff(days, cutoff)
         all_papers: List[Paper] = []
         seen_urls: Set[str] = set()
 
-        for category in self.categories:
-            print(f"Fetching papers from category: {category}")
+        max_workers = max(1, min(self.max_workers, len(self._batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._fetch_batch, batch, search, cutoff_date, rate_limit_delay)
+                for batch, search in zip(self._batches, self._batch_searches)
+            ]
 
-            # Build search query for this category
-            query = f"cat:{category}"
+            batch_papers = [future.result() for future in futures]
 
-            # Create search with sorting by submission date
-            search = arxiv.Search(
-                query=query,
-                max_results=self.max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-            )
+        # Every batch is already newest first, so merge them into one
+        # newest-first stream instead of concatenating and re-sorting
+        for paper in heapq.merge(*batch_papers, key=_published, reverse=True):
+            # Avoid duplicates (papers can be in multiple categories)
+            if paper.url in seen_urls:
+                continue
 
-            try:
-                results = self.client.results(search)
-
-                for result in results:
-                    # Check if paper is within date range
-                    if result.published < cutoff_date:
-                        # Since we're sorted by date, we can break early
-                        break
-
-                    # Avoid duplicates (papers can be in multiple categories)
-                    if result.entry_id in seen_urls:
-                        continue
-
-                    seen_urls.add(result.entry_id)
-
-                    # Convert to unified Paper format
-                    paper = Paper(
-                        title=result.title,
-                        authors=[author.name for author in result.authors],
-                        abstract=result.summary,
-                        url=result.entry_id,
-                        published=result.published,
-                        source=self.source_name,
-                        categories=result.categories,
-                        pdf_url=result.pdf_url,
-                    )
-                    all_papers.append(paper)
+            seen_urls.add(paper.url)
+            all_papers.append(paper)
+
+        logger.info("Fetched %d unique papers total", len(all_papers))
+        return all_papers
+
+    def _fetch_batch(
+        self,
+        categories: List[str],
+        search: arxiv.Search,
+        cutoff_date: datetime,
+        rate_limit_delay: float,
+    ) -> List[Paper]:
+        """Fetch recent papers from a batch of ArXiv categories.
+
+        Args:
+            categories: ArXiv category codes covered by the search
+            search: Batched search for the categories
+            cutoff_date: Only include papers published after this date
+            rate_limit_delay: Delay between requests in seconds
+
+        Returns:
+            List of Paper objects
+        """
+        cache_key = self._get_cache_key(search, cutoff_date)
+        cached = self._load_from_cache(cache_key)
+        if cached is not None:
+            logger.info("Using cached papers for categories %s", ', '.join(categories))
+            # Cached papers were filtered against an earlier cutoff
+            return [paper for paper in cached if paper.published >= cutoff_date]
+
+        logger.info("Fetching papers from categories %s", ', '.join(categories))
+        try:
+            papers = self._run_search(search, cutoff_date, rate_limit_delay)
+        except Exception as e:
+            logger.error("Error fetching from categories %s: %s", ', '.join(categories), e)
+            return []
+
+        self._save_to_cache(cache_key, papers)
+        return papers
 
-                # Rate limiting to be respectful to ArXiv API
-                time.sleep(rate_limit_delay)
+    def _get_cache_key(self, search: arxiv.Search, cutoff_date: datetime) -> str:
+        """Generate cache key from a search and the day of its cutoff date.
 
-            except Exception as e:
-                print(f"Error fetching from category {category}: {e}")
+        Args:
+            search: ArXiv search
+            cutoff_date: Only include papers published after this date
+
+        Returns:
+            SHA-1 hash as cache key
+        """
+        content = f"{search.query}|{search.max_results}|{cutoff_date:%Y%m%d}"
+        return hashlib.sha1(content.encode()).hexdigest()
+
+    def _load_from_cache(self, cache_key: str) -> Optional[List[Paper]]:
+        """Load papers from the cache if the entry is still fresh.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Cached papers or None
+        """
+        if self.cache_dir is None:
+            return None
+
+        cache_file = self.cache_dir / f"{cache_key}.pkl.gz"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            with gzip.open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Missing, stale or unreadable entries are simply refetched
+            return None
+
+    def _save_to_cache(self, cache_key: str, papers: List[Paper]) -> None:
+        """Save fetched papers to the cache.
+
+        Args:
+            cache_key: Cache key
+            papers: Papers to cache
+        """
+        if self.cache_dir is None:
+            return
+
+        cache_file = self.cache_dir / f"{cache_key}.pkl.gz"
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_file, "wb") as f:
+                pickle.dump(papers, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning("Could not write ArXiv cache: %s", e)
+            return
+
+        self._prune_cache()
+
+    def _prune_cache(self) -> int:
+        """Delete cache files older than cache_ttl.
+
+        Keys include the cutoff day, so every day adds new files; expired ones
+        are never read again.
+
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - self.cache_ttl
+        removed = 0
+        try:
+            paths = list(self.cache_dir.iterdir())
+        except OSError:
+            return 0
+
+        for path in paths:
+            if not path.name.endswith(('.pkl.gz', '.tmp')):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
                 continue
 
-        print(f"Fetched {len(all_papers)} unique papers total")
-        return all_papers
+        if removed:
+            logger.info("  Pruned %d stale ArXiv cache files", removed)
+        return removed
+
+    def _run_search(
+        self,
+        search: arxiv.Search,
+        cutoff_date: datetime,
+        rate_limit_delay: float,
+    ) -> List[Paper]:
+        """Run a search under the shared request slot and convert recent results.
+
+        Args:
+            search: ArXiv search sorted by submission date (newest first)
+            cutoff_date: Only include papers published after this date
+            rate_limit_delay: Delay between requests in seconds
+
+        Returns:
+            List of Paper objects
+        """
+        def is_recent(result: arxiv.Result) -> bool:
+            return result.published >= cutoff_date
+
+        # Rate limiting to be respectful to ArXiv API
+        with _REQUEST_SLOT.hold(rate_limit_delay):
+            # Since we're sorted by date, stop at the first older result so the
+            # lazy result stream never requests pages past the cutoff
+            results = takewhile(is_recent, self.client.results(search))
+            return [self._to_paper(result) for result in results]
+
+    def _to_paper(self, result: arxiv.Result) -> Paper:
+        """Convert an ArXiv result to the unified Paper format.
+
+        Args:
+            result: ArXiv search result
+
+        Returns:
+            Paper object
+        """
+        return Paper(
+            title=result.title,
+            authors=list(map(_author_name, result.authors)),
+            abstract=result.summary,
+            url=result.entry_id,
+            published=result.published,
+            source=self.source_name,
+            categories=result.categories,
+            pdf_url=result.pdf_url,
+        )
 
     def fetch_by_keyword_search(
         self,
         keywords: List[str],
         days: int = 7,
         max_results: int = 50,
+        rate_limit_delay: float = 3.0,
     ) -> List[Paper]:
         """Fetch papers by direct keyword search (alternative method).
 
@@ -106,11 +386,12 @@ class ArXivFetcher(BaseFetcher):
             keywords: List of keywords to search
             days: Number of days to look back
             max_results: Maximum results
+            rate_limit_delay: Delay between requests in seconds
 
         Returns:
             List of Paper objects
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff_date = self._resolve_cutoff(days)
         all_papers: List[Paper] = []
         seen_urls: Set[str] = set()
 
@@ -120,43 +401,22 @@ class ArXivFetcher(BaseFetcher):
 
         # Combine with category filter if categories exist
         if self.categories:
-            cat_query = " OR ".join([f"cat:{cat}" for cat in self.categories])
-            query = f"({keyword_query}) AND ({cat_query})"
+            query = f"({keyword_query}) AND ({_category_query(self.categories)})"
         else:
             query = keyword_query
 
-        print(f"Searching ArXiv with query: {query[:100]}...")
+        logger.info("Searching ArXiv with query: %s...", query[:100])
 
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.SubmittedDate,
-            sort_order=arxiv.SortOrder.Descending,
-        )
+        search = self._build_search(query, max_results)
 
         try:
-            results = self.client.results(search)
-
-            for result in results:
-                if result.published < cutoff_date:
-                    continue
-
-                if result.entry_id not in seen_urls:
-                    seen_urls.add(result.entry_id)
-                    paper = Paper(
-                        title=result.title,
-                        authors=[author.name for author in result.authors],
-                        abstract=result.summary,
-                        url=result.entry_id,
-                        published=result.published,
-                        source=self.source_name,
-                        categories=result.categories,
-                        pdf_url=result.pdf_url,
-                    )
+            for paper in self._run_search(search, cutoff_date, rate_limit_delay):
+                if paper.url not in seen_urls:
+                    seen_urls.add(paper.url)
                     all_papers.append(paper)
 
         except Exception as e:
-            print(f"Error during keyword search: {e}")
+            logger.error("Error during keyword search: %s", e)
 
-        print(f"Found {len(all_papers)} papers via keyword search")
+        logger.info("Found %d papers via keyword search", len(all_papers))
         return all_papers
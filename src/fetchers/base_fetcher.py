@@ -1,14 +1,23 @@
 """Base fetcher class for all paper sources."""
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
 
+# Identifies the aggregator to APIs and feed hosts (CrossRef's polite pool
+# asks for a contact address)
+USER_AGENT = 'ResearchWeeklyFeed/0.1 (mailto:research@example.com)'
 
-@dataclass
+
+@dataclass(slots=True)
 class Paper:
-    """Unified paper representation across all sources."""
+    """Unified paper representation across all sources.
+
+    Uses ``__slots__`` since a run creates one instance per fetched paper, so
+    attributes must be declared here before scorers can set them.
+    """
 
     title: str
     authors: List[str]
@@ -22,12 +31,8 @@ class Paper:
 
     # Filtering metadata
     relevance_score: int = 0
-    matched_keywords: List[str] = None
-
-    def __post_init__(self):
-        """Initialize matched_keywords if None."""
-        if self.matched_keywords is None:
-            self.matched_keywords = []
+    matched_keywords: List[str] = field(default_factory=list)
+    llm_metadata: Optional[Dict[str, Any]] = None
 
     def __repr__(self) -> str:
         return f"Paper(title={self.title!r}, source={self.source!r}, published={self.published})"
@@ -42,20 +47,39 @@ class BaseFetcher(ABC):
         Args:
             source_name: Name of the source (e.g., "ArXiv", "SAGE", "Nature")
         """
-        self.source_name = source_name
+        # Interned so every paper from this fetcher shares one source string
+        self.source_name = sys.intern(source_name)
 
     @abstractmethod
-    def fetch_papers(self, days: int = 7) -> List[Paper]:
+    def fetch_papers(self, days: int = 7, *, cutoff: Optional[datetime] = None) -> List[Paper]:
         """Fetch papers from the source.
 
         Args:
             days: Number of days to look back
+            cutoff: Only include papers published after this date (overrides days)
 
         Returns:
             List of Paper objects
         """
         pass
 
+    def _resolve_cutoff(self, days: int, cutoff: Optional[datetime] = None) -> datetime:
+        """Get the cutoff date for a fetch.
+
+        Passing the same cutoff to every fetcher keeps sources consistent when
+        they run concurrently.
+
+        Args:
+            days: Number of days to look back
+            cutoff: Explicit cutoff date, if any
+
+        Returns:
+            Timezone-aware cutoff date
+        """
+        if cutoff is not None:
+            return cutoff
+        return datetime.now(timezone.utc) - timedelta(days=days)
+
     def _normalize_authors(self, authors: Union[str, List[str]]) -> List[str]:
         """Normalize author names to list format.
 
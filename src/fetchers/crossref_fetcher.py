@@ -1,75 +1,164 @@
 """CrossRef API fetcher for journals without RSS feeds."""
 
-import time
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
+from urllib3.util.retry import Retry
 
-from src.fetchers.base_fetcher import BaseFetcher, Paper
+from src.fetchers.base_fetcher import USER_AGENT, BaseFetcher, Paper
+from src.fetchers.http_cache import HTTPCache
+from src.fetchers.rate_limit import RateLimitedAdapter, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for decoding large API payloads; it parses bytes directly
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Only the fields _parse_crossref_item reads
+SELECT_FIELDS = (
+    'DOI,title,author,abstract,URL,'
+    'published-print,published-online,published,created'
+)
+ROWS_PER_PAGE = 200
+# Safety bound on cursor paging for a single journal
+MAX_PAGES = 10
+
+# Date fields tried in order of preference
+DATE_FIELDS = ('published-print', 'published-online', 'published', 'created')
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_UTC = timezone.utc
 
 
 class CrossRefFetcher(BaseFetcher):
     """Fetches papers from CrossRef API for journals without RSS."""
 
-    def __init__(self, journals: Dict[str, Dict[str, str]]):
+    def __init__(
+        self,
+        journals: Dict[str, Dict[str, str]],
+        max_workers: int = 4,
+        cache_dir: Optional[Union[str, Path]] = ".cache/http",
+        cache_ttl: float = 3600.0,
+    ):
         """Initialize CrossRef fetcher.
 
         Args:
             journals: Dictionary of journal configs {code: {name, issn}}
+            max_workers: Maximum number of journals fetched concurrently
+            cache_dir: Directory to cache API responses (None disables caching)
+            cache_ttl: Seconds a cached response is used without revalidation
         """
         super().__init__("CrossRef")
         self.journals = journals
-        self.base_url = "https://api.crossref.org/works"
-        self.rate_limit = 50  # CrossRef allows 50 requests per second
+        self.max_workers = max_workers
+        self.base_url = "https://api.crossref.org/journals/{issn}/works"
+
+        # Every network request from any worker thread takes a token. Each
+        # fetch starts from its rate_limit_delay, then follows the limit
+        # CrossRef reports in its X-Rate-Limit-* response headers
+        self._rate_limiter = TokenBucket(rate=2.0)
+
+        # One pooled session so every journal reuses the same TLS connections.
+        # Throttled or failed requests are retried with jittered exponential
+        # backoff, honouring Retry-After on 429 responses
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = USER_AGENT
+        self._session.hooks['response'].append(self._update_rate_limit)
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        self._session.mount(
+            'https://',
+            RateLimitedAdapter(
+                self._rate_limiter,
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=retries,
+            ),
+        )
+        self._cache = HTTPCache(cache_dir, cache_ttl) if cache_dir is not None else None
 
     def fetch_papers(
         self,
         days: int = 7,
         rate_limit_delay: float = 0.5,
         specific_journal: Optional[str] = None,
+        *,
+        cutoff: Optional[datetime] = None,
     ) -> List[Paper]:
         """Fetch papers from CrossRef API.
 
         Args:
             days: Number of days to look back
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Delay between requests in seconds until CrossRef
+                reports its rate limit (0 disables limiting)
             specific_journal: Optional specific journal code to fetch
+            cutoff: Only include papers published after this date (overrides days)
 
         Returns:
             List of Paper objects
         """
-        from_date = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+        from_date = self._resolve_cutoff(days, cutoff).strftime('%Y-%m-%d')
+        # Fallback publication date for items without one, shared by the run
+        run_now = datetime.now(_UTC)
         all_papers: List[Paper] = []
+        self._rate_limiter.update(1.0 / rate_limit_delay if rate_limit_delay > 0 else 0.0)
+        if self._cache is not None:
+            # Each day's from-pub-date makes new cache entries; drop old ones
+            self._cache.prune()
 
-        # Filter to specific journal if requested
-        journals_to_fetch = self.journals
+        # A single requested journal is fetched directly, without a worker pool
         if specific_journal:
-            if specific_journal in self.journals:
-                journals_to_fetch = {specific_journal: self.journals[specific_journal]}
-            else:
-                print(f"Warning: Journal '{specific_journal}' not found in configuration")
+            journal_info = self.journals.get(specific_journal)
+            if not journal_info:
+                logger.warning("Journal '%s' not found in configuration", specific_journal)
                 return []
+            papers = self._fetch_by_issn(
+                journal_info['issn'], journal_info['name'], from_date, run_now
+            )
+            logger.info("  %s: %d recent papers", journal_info['name'], len(papers))
+            return papers
+
+        # Journals are fetched concurrently; the shared token bucket keeps the
+        # combined request rate within the API's limit
+        journals = list(self.journals.values())
+        max_workers = max(1, min(self.max_workers, len(journals)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    journal_info['name'],
+                    executor.submit(
+                        self._fetch_by_issn,
+                        journal_info['issn'],
+                        journal_info['name'],
+                        from_date,
+                        run_now,
+                    ),
+                )
+                for journal_info in journals
+            ]
+
+            # Collect in configuration order so results are deterministic
+            for journal_name, future in futures:
+                try:
+                    papers = future.result()
+                    all_papers.extend(papers)
+                    logger.info("  %s: %d recent papers", journal_name, len(papers))
+                except Exception as e:
+                    logger.error("  Error fetching from %s: %s", journal_name, e)
 
-        for journal_code, journal_info in journals_to_fetch.items():
-            journal_name = journal_info['name']
-            issn = journal_info['issn']
-
-            print(f"Fetching from {journal_name} via CrossRef...")
-
-            try:
-                papers = self._fetch_by_issn(issn, journal_name, from_date)
-                all_papers.extend(papers)
-                print(f"  Found {len(papers)} recent papers")
-
-                # Rate limiting
-                time.sleep(rate_limit_delay)
-
-            except Exception as e:
-                print(f"  Error fetching from {journal_name}: {e}")
-                continue
-
-        print(f"Total papers fetched from CrossRef: {len(all_papers)}")
+        logger.info("Total papers fetched from CrossRef: %d", len(all_papers))
         return all_papers
 
     def _fetch_by_issn(
@@ -77,6 +166,7 @@ class CrossRefFetcher(BaseFetcher):
         issn: str,
         journal_name: str,
         from_date: str,
+        run_now: datetime,
     ) -> List[Paper]:
         """Fetch papers by ISSN from CrossRef.
 
@@ -84,53 +174,131 @@ class CrossRefFetcher(BaseFetcher):
             issn: Journal ISSN
             journal_name: Name of the journal
             from_date: Date in YYYY-MM-DD format
+            run_now: Publication date used for items without one
 
         Returns:
             List of Paper objects
         """
+        logger.info("Fetching from %s via CrossRef...", journal_name)
         papers: List[Paper] = []
 
+        # The per-journal endpoint with a field projection returns far smaller
+        # payloads than /works; the cursor pages through every match
+        url = self.base_url.format(issn=issn)
         params = {
-            'filter': f'issn:{issn},from-pub-date:{from_date}',
-            'rows': 100,
-            'sort': 'published',
-            'order': 'desc',
+            'filter': f'from-pub-date:{from_date}',
+            'select': SELECT_FIELDS,
+            'rows': ROWS_PER_PAGE,
+            'cursor': '*',
         }
 
         try:
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers={'User-Agent': 'ResearchWeeklyFeed/0.1 (mailto:research@example.com)'},
-                timeout=30,
-            )
-            response.raise_for_status()
-
-            data = response.json()
-
-            if 'message' in data and 'items' in data['message']:
-                for item in data['message']['items']:
+            for page in range(MAX_PAGES):
+                try:
+                    # Cursors are single-use, so only the first page is cached
+                    data, from_cache = self._get_json(url, params, use_cache=page == 0)
+                    if from_cache and (
+                        len(data.get('message', {}).get('items', [])) >= ROWS_PER_PAGE
+                    ):
+                        # A cached first page may carry an expired cursor, so
+                        # refetch it when more pages follow
+                        data, _ = self._get_json(url, params, use_cache=False)
+                except requests.exceptions.RequestException as e:
+                    if page == 0:
+                        raise
+                    logger.warning(
+                        "  Stopped paging %s after %d pages: %s", journal_name, page, e
+                    )
+                    break
+
+                message = data.get('message', {})
+                items = message.get('items', [])
+
+                for item in items:
                     try:
-                        paper = self._parse_crossref_item(item, journal_name)
+                        paper = self._parse_crossref_item(item, journal_name, run_now)
                         if paper:
                             papers.append(paper)
                     except Exception as e:
-                        print(f"  Warning: Error parsing item: {e}")
+                        logger.warning("  Error parsing item: %s", e)
                         continue
 
+                next_cursor = message.get('next-cursor')
+                if len(items) < ROWS_PER_PAGE or not next_cursor:
+                    break
+                params['cursor'] = next_cursor
+
         except requests.exceptions.RequestException as e:
-            print(f"  HTTP error: {e}")
+            logger.error("  HTTP error: %s", e)
         except Exception as e:
-            print(f"  Unexpected error: {e}")
+            logger.error("  Unexpected error: %s", e)
 
         return papers
 
-    def _parse_crossref_item(self, item: dict, journal_name: str) -> Optional[Paper]:
+    def _update_rate_limit(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        """Adapt the request rate to the limit reported by CrossRef.
+
+        Registered as a session response hook. CrossRef sends e.g.
+        ``X-Rate-Limit-Limit: 50`` and ``X-Rate-Limit-Interval: 1s``.
+
+        Args:
+            response: Response received from the API
+            *args: Unused hook arguments
+            **kwargs: Unused hook arguments
+        """
+        limit = response.headers.get('X-Rate-Limit-Limit')
+        interval = response.headers.get('X-Rate-Limit-Interval')
+        if not limit or not interval:
+            return
+
+        try:
+            requests_per_interval = float(limit)
+            interval_seconds = float(interval.rstrip('s'))
+        except ValueError:
+            return
+
+        if requests_per_interval > 0 and interval_seconds > 0:
+            rate = requests_per_interval / interval_seconds
+            if rate != self._rate_limiter.rate:
+                self._rate_limiter.update(rate, capacity=requests_per_interval)
+
+    def _get_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        use_cache: bool = True,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """GET a CrossRef API URL and decode the JSON response.
+
+        Args:
+            url: API URL
+            params: Query parameters
+            use_cache: Whether the response may be served from or stored in the cache
+
+        Returns:
+            Tuple of (decoded JSON response, whether it was served from the cache)
+        """
+        if use_cache and self._cache is not None:
+            body, from_cache = self._cache.fetch(self._session, url, params=params)
+        else:
+            response = self._session.get(url, params=params, timeout=30)
+            response.raise_for_status()
+            body, from_cache = response.content, False
+
+        return _json_loads(body), from_cache
+
+    def _parse_crossref_item(
+        self,
+        item: dict,
+        journal_name: str,
+        run_now: datetime,
+    ) -> Optional[Paper]:
         """Parse a CrossRef item into a Paper object.
 
         Args:
             item: CrossRef API item
             journal_name: Name of the journal
+            run_now: Publication date used if the item has none
 
         Returns:
             Paper object or None
@@ -156,10 +324,9 @@ class CrossRefFetcher(BaseFetcher):
 
         # Extract abstract
         abstract = item.get('abstract', '')
-        if abstract:
+        if abstract and '<' in abstract:
             # Remove JATS XML tags if present
-            import re
-            abstract = re.sub(r'<[^>]+>', '', abstract)
+            abstract = _TAG_RE.sub('', abstract)
 
         # Extract DOI
         doi = item.get('DOI', '')
@@ -170,7 +337,7 @@ class CrossRefFetcher(BaseFetcher):
         # Extract publication date
         pub_date = self._extract_crossref_date(item)
         if not pub_date:
-            pub_date = datetime.now(timezone.utc)
+            pub_date = run_now
 
         paper = Paper(
             title=title,
@@ -194,16 +361,20 @@ class CrossRefFetcher(BaseFetcher):
             Datetime object or None
         """
         # Try different date fields
-        for date_field in ['published-print', 'published-online', 'published', 'created']:
-            date_parts = item.get(date_field, {}).get('date-parts', [[]])
-            if date_parts and date_parts[0]:
-                try:
-                    year = date_parts[0][0]
-                    month = date_parts[0][1] if len(date_parts[0]) > 1 else 1
-                    day = date_parts[0][2] if len(date_parts[0]) > 2 else 1
-                    dt = datetime(year, month, day, tzinfo=timezone.utc)
-                    return dt
-                except (ValueError, IndexError):
-                    continue
+        for date_field in DATE_FIELDS:
+            date_info = item.get(date_field)
+            if not date_info:
+                continue
+            date_parts = date_info.get('date-parts')
+            if not date_parts or not date_parts[0]:
+                continue
+            parts = date_parts[0]
+            try:
+                year = parts[0]
+                month = parts[1] if len(parts) > 1 else 1
+                day = parts[2] if len(parts) > 2 else 1
+                return datetime(year, month, day, tzinfo=_UTC)
+            except (TypeError, ValueError):
+                continue
 
         return None
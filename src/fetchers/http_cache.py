@@ -0,0 +1,234 @@
+"""On-disk HTTP response cache with conditional request support."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Entries untouched for this long are deleted by HTTPCache.prune()
+STALE_ENTRY_AGE = 7 * 24 * 3600.0
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with the validators needed to revalidate it."""
+
+    body: bytes
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HTTPCache:
+    """Caches GET response bodies on disk.
+
+    Fresh entries are served without any request. Stale entries are
+    revalidated with If-None-Match / If-Modified-Since, so unchanged feeds
+    cost a 304 instead of a full download.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = ".cache/http",
+        expire_after: float = 3600.0,
+    ):
+        """Initialize HTTP cache.
+
+        Args:
+            cache_dir: Directory to store cached responses
+            expire_after: Seconds a cached response is served without revalidation
+        """
+        self.cache_dir = Path(cache_dir)
+        self.expire_after = expire_after
+
+    def _get_cache_key(self, url: str) -> str:
+        """Generate cache key from a full request URL.
+
+        Args:
+            url: Request URL including query string
+
+        Returns:
+            SHA-1 hash as cache key
+        """
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        """Load a cached response.
+
+        Args:
+            url: Request URL including query string
+
+        Returns:
+            Cached response or None
+        """
+        cache_key = self._get_cache_key(url)
+        try:
+            with open(self.cache_dir / f"{cache_key}.json") as f:
+                meta = json.load(f)
+            with open(self.cache_dir / f"{cache_key}.body", "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        return CachedResponse(
+            body=body,
+            fetched_at=meta.get("fetched_at", 0.0),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def save(self, url: str, entry: CachedResponse) -> None:
+        """Save a response to the cache.
+
+        Args:
+            url: Request URL including query string
+            entry: Response to cache
+        """
+        cache_key = self._get_cache_key(url)
+        meta = {
+            "url": url,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first: metadata without a matching body is never read
+            self._write_atomic(self.cache_dir / f"{cache_key}.body", entry.body)
+            self._write_atomic(
+                self.cache_dir / f"{cache_key}.json",
+                json.dumps(meta, separators=(',', ':')).encode(),
+            )
+        except OSError as e:
+            logger.warning("  Could not write HTTP cache: %s", e)
+
+    def prune(self, max_age: float = STALE_ENTRY_AGE) -> int:
+        """Delete cache files that have not been written for max_age seconds.
+
+        URLs with a date in the query string (e.g. CrossRef's from-pub-date
+        filter) get a new entry every day, so old ones must be removed.
+
+        Args:
+            max_age: Age in seconds after which a cache file is deleted
+
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - max(max_age, self.expire_after)
+        removed = 0
+        try:
+            paths = list(self.cache_dir.iterdir())
+        except OSError:
+            return 0
+
+        for path in paths:
+            if path.suffix not in ('.json', '.body', '.tmp'):
+                continue
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+
+        if removed:
+            logger.info("  Pruned %d stale HTTP cache files", removed)
+        return removed
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """Write a file via a temporary file so readers never see partial data.
+
+        Args:
+            path: Destination path
+            data: File contents
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+    ) -> bytes:
+        """GET a URL through the cache.
+
+        Args:
+            session: Session used for network requests
+            url: Request URL
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        return self.fetch(session, url, params=params, timeout=timeout)[0]
+
+    def fetch(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: float = 30,
+    ) -> Tuple[bytes, bool]:
+        """GET a URL through the cache and report where the body came from.
+
+        Args:
+            session: Session used for network requests
+            url: Request URL
+            params: Optional query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (response body, whether the body is a cached copy). A
+            304 revalidation counts as cached: the body was stored earlier.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        cached = self.load(full_url)
+
+        if cached and time.time() - cached.fetched_at < self.expire_after:
+            return cached.body, True
+
+        headers: Dict[str, str] = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        response = session.get(full_url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            # Unchanged upstream: keep the body, restart the freshness window
+            cached.fetched_at = time.time()
+            self.save(full_url, cached)
+            return cached.body, True
+
+        response.raise_for_status()
+        self.save(
+            full_url,
+            CachedResponse(
+                body=response.content,
+                fetched_at=time.time(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            ),
+        )
+        return response.content, False
@@ -0,0 +1,151 @@
+"""Request rate limiting shared by fetcher worker threads."""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces request starts.
+
+    Each request takes one token. Tokens refill at ``rate`` per second up to
+    ``capacity``, so short bursts are allowed while the long-run request rate
+    never exceeds ``rate``. The rate can be changed at any time, e.g. once an
+    API reports its actual limit.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: Maximum number of tokens, i.e. the largest burst
+        """
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill.
+
+        Args:
+            now: Current monotonic time
+        """
+        if self.rate > 0:
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def update(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Change the refill rate and, optionally, the capacity.
+
+        Args:
+            rate: Tokens added per second (0 or less disables limiting)
+            capacity: New maximum number of tokens, if any
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+                self._tokens = min(self._tokens, capacity)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            if self.rate <= 0:
+                return
+            self._refill(time.monotonic())
+            # Reserve the token now (possibly going negative) and sleep for
+            # the deficit outside the lock, so other threads can queue behind
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host, so each host is paced independently.
+
+    Useful when requests go to many publishers: requests to different hosts
+    never wait for each other, while each host sees a polite request rate.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize per-host rate limiter.
+
+        Args:
+            rate: Requests per second allowed for each host (0 or less disables limiting)
+            capacity: Largest burst allowed for each host
+        """
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def update(self, rate: float) -> None:
+        """Change the per-host rate for current and future hosts.
+
+        Args:
+            rate: Requests per second allowed for each host
+        """
+        with self._lock:
+            self.rate = rate
+            buckets = list(self._buckets.values())
+        for bucket in buckets:
+            bucket.update(rate)
+
+    def acquire(self, url: str) -> None:
+        """Take one token from the bucket of the URL's host.
+
+        Args:
+            url: Request URL
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.capacity)
+        bucket.acquire()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP adapter that takes a token before every network request.
+
+    Responses served from a local cache never reach the adapter, so they do
+    not count against the limit.
+    """
+
+    def __init__(self, rate_limiter: Union[TokenBucket, HostRateLimiter], **kwargs: Any):
+        """Initialize adapter.
+
+        Args:
+            rate_limiter: Token bucket shared by all requests through this
+                adapter, or a per-host limiter
+            **kwargs: Passed to HTTPAdapter (pool sizes, max_retries, ...)
+        """
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        """Wait for a token, then send the request.
+
+        Args:
+            request: Prepared request
+            *args: Passed to HTTPAdapter.send
+            **kwargs: Passed to HTTPAdapter.send
+
+        Returns:
+            Response object
+        """
+        if isinstance(self.rate_limiter, HostRateLimiter):
+            self.rate_limiter.acquire(request.url)
+        else:
+            self.rate_limiter.acquire()
+        return super().send(request, *args, **kwargs)
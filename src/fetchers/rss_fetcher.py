@@ -1,82 +1,168 @@
 """RSS feed fetcher for journals with RSS support."""
 
-import time
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+import hashlib
+import logging
+import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 from xml.etree.ElementTree import ParseError
 
 import feedparser
+import requests
 
-from src.fetchers.base_fetcher import BaseFetcher, Paper
+from src.fetchers.base_fetcher import USER_AGENT, BaseFetcher, Paper
+from src.fetchers.http_cache import HTTPCache
+from src.fetchers.rate_limit import HostRateLimiter, RateLimitedAdapter
+
+logger = logging.getLogger(__name__)
+
+_TAG_RE = re.compile(r'<[^>]+>')
+# Script and style bodies are code, not text, so they go with their tags
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+# Bump when _parse_entries output changes so cached entries are parsed again
+_PARSED_FEED_VERSION = 2
 
 
 class RSSFetcher(BaseFetcher):
     """Fetches papers from RSS feeds (SAGE, Nature, PNAS, etc.)."""
 
-    def __init__(self, journals: Dict[str, Dict[str, str]], source_group: str = "RSS"):
+    def __init__(
+        self,
+        journals: Dict[str, Dict[str, str]],
+        source_group: str = "RSS",
+        max_workers: int = 8,
+        cache_dir: Optional[Union[str, Path]] = ".cache/http",
+        cache_ttl: float = 3600.0,
+        parsed_cache_dir: Optional[Union[str, Path]] = ".cache/feeds",
+    ):
         """Initialize RSS fetcher.
 
         Args:
             journals: Dictionary of journal configs {code: {name, rss}}
             source_group: Source group name (e.g., "SAGE", "Nature", "Other")
+            max_workers: Maximum number of feeds fetched concurrently
+            cache_dir: Directory to cache feed responses (None disables caching)
+            cache_ttl: Seconds a cached feed is used without revalidation
+            parsed_cache_dir: Directory to cache parsed feed entries (None disables it)
         """
         super().__init__(source_group)
         self.journals = journals
+        self.max_workers = max_workers
+
+        # Network requests are paced per host: feeds from different publishers
+        # are fetched in parallel, feeds on the same host are spaced out
+        self._rate_limiter = HostRateLimiter(rate=0.5)
+
+        # Feeds are downloaded here rather than by feedparser so responses can
+        # be cached and revalidated with ETag / Last-Modified
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = USER_AGENT
+        adapter = RateLimitedAdapter(self._rate_limiter, pool_maxsize=max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._cache = HTTPCache(cache_dir, cache_ttl) if cache_dir is not None else None
+        self.parsed_cache_dir = Path(parsed_cache_dir) if parsed_cache_dir is not None else None
 
     def fetch_papers(
         self,
         days: int = 7,
         rate_limit_delay: float = 2.0,
         specific_journal: Optional[str] = None,
+        *,
+        cutoff: Optional[datetime] = None,
     ) -> List[Paper]:
         """Fetch papers from RSS feeds.
 
         Args:
             days: Number of days to look back
-            rate_limit_delay: Delay between requests in seconds
+            rate_limit_delay: Delay between requests to the same host in seconds
             specific_journal: Optional specific journal code to fetch
+            cutoff: Only include papers published after this date (overrides days)
 
         Returns:
             List of Paper objects
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff_date = self._resolve_cutoff(days, cutoff)
+        # Fallback publication date for entries without one, shared by the run
+        run_now = datetime.now(timezone.utc)
         all_papers: List[Paper] = []
+        self._rate_limiter.update(1.0 / rate_limit_delay if rate_limit_delay > 0 else 0.0)
 
-        # Filter to specific journal if requested
-        journals_to_fetch = self.journals
+        # A single requested journal is fetched directly, without a worker pool
         if specific_journal:
-            if specific_journal in self.journals:
-                journals_to_fetch = {specific_journal: self.journals[specific_journal]}
-            else:
-                print(f"Warning: Journal '{specific_journal}' not found in configuration")
+            journal_info = self.journals.get(specific_journal)
+            if not journal_info:
+                logger.warning("Journal '%s' not found in configuration", specific_journal)
                 return []
+            logger.info("Fetching from %s...", journal_info['name'])
+            papers = self._parse_rss_feed(
+                journal_info['rss'], journal_info['name'], cutoff_date, run_now
+            )
+            logger.info("  Found %d recent papers", len(papers))
+            return papers
+
+        # Downloading and parsing overlap across feeds; the per-host rate
+        # limiter keeps each publisher at a polite request rate
+        journals = list(self.journals.values())
+        max_workers = max(1, min(self.max_workers, len(journals)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (
+                    journal_info['name'],
+                    executor.submit(
+                        self._fetch_journal,
+                        journal_info['rss'],
+                        journal_info['name'],
+                        cutoff_date,
+                        run_now,
+                    ),
+                )
+                for journal_info in journals
+            ]
+
+            # Collect in configuration order so results are deterministic
+            for journal_name, future in futures:
+                try:
+                    papers = future.result()
+                    all_papers.extend(papers)
+                    logger.info("  %s: %d recent papers", journal_name, len(papers))
+                except Exception as e:
+                    logger.error("  Error fetching from %s: %s", journal_name, e)
 
-        for journal_code, journal_info in journals_to_fetch.items():
-            journal_name = journal_info['name']
-            rss_url = journal_info['rss']
-
-            print(f"Fetching from {journal_name}...")
-
-            try:
-                papers = self._parse_rss_feed(rss_url, journal_name, cutoff_date)
-                all_papers.extend(papers)
-                print(f"  Found {len(papers)} recent papers")
+        logger.info("Total papers fetched from %s: %d", self.source_name, len(all_papers))
+        return all_papers
 
-                # Rate limiting
-                time.sleep(rate_limit_delay)
+    def _fetch_journal(
+        self,
+        rss_url: str,
+        journal_name: str,
+        cutoff_date: datetime,
+        run_now: datetime,
+    ) -> List[Paper]:
+        """Fetch one journal's feed on a worker thread.
 
-            except Exception as e:
-                print(f"  Error fetching from {journal_name}: {e}")
-                continue
+        Args:
+            rss_url: URL of the RSS feed
+            journal_name: Name of the journal
+            cutoff_date: Only include papers after this date
+            run_now: Publication date used for entries without one
 
-        print(f"Total papers fetched from {self.source_name}: {len(all_papers)}")
-        return all_papers
+        Returns:
+            List of Paper objects
+        """
+        logger.info("Fetching from %s...", journal_name)
+        return self._parse_rss_feed(rss_url, journal_name, cutoff_date, run_now)
 
     def _parse_rss_feed(
         self,
         rss_url: str,
         journal_name: str,
         cutoff_date: datetime,
+        run_now: datetime,
     ) -> List[Paper]:
         """Parse an RSS feed and extract papers.
 
@@ -84,6 +170,7 @@ class RSSFetcher(BaseFetcher):
             rss_url: URL of the RSS feed
             journal_name: Name of the journal
             cutoff_date: Only include papers after this date
+            run_now: Publication date used for entries without one
 
         Returns:
             List of Paper objects
@@ -91,66 +178,160 @@ class RSSFetcher(BaseFetcher):
         papers: List[Paper] = []
 
         try:
-            feed = feedparser.parse(rss_url)
-
-            # Check if feed was parsed successfully
-            if feed.bozo and not feed.entries:
-                print(f"  Warning: Feed may have errors: {feed.get('bozo_exception', 'Unknown error')}")
-                return papers
-
-            for entry in feed.entries:
-                try:
-                    # Extract publication date
-                    pub_date = self._extract_date(entry)
-                    if not pub_date:
-                        # If no date, skip date filtering
-                        pub_date = datetime.now(timezone.utc)
-                    elif pub_date < cutoff_date:
-                        continue
-
-                    # Extract title
-                    title = entry.get('title', '').strip()
-                    if not title:
-                        continue
-
-                    # Extract authors
-                    authors = self._extract_authors(entry)
-
-                    # Extract abstract/summary
-                    abstract = entry.get('summary', entry.get('description', '')).strip()
-                    # Remove HTML tags if present
-                    if abstract:
-                        import re
-                        abstract = re.sub(r'<[^>]+>', '', abstract)
-
-                    # Extract link
-                    link = entry.get('link', entry.get('id', ''))
-
-                    # Extract DOI if available
-                    doi = self._extract_doi(entry)
-
-                    paper = Paper(
-                        title=title,
-                        authors=authors,
-                        abstract=abstract,
-                        url=link,
-                        published=pub_date,
-                        source=journal_name,
-                        doi=doi,
-                    )
-                    papers.append(paper)
-
-                except Exception as e:
-                    print(f"  Warning: Error parsing entry: {e}")
+            if self._cache is not None:
+                body = self._cache.get(self._session, rss_url)
+            else:
+                response = self._session.get(rss_url, timeout=30)
+                response.raise_for_status()
+                body = response.content
+
+            # An unchanged feed body yields the same entries, so reuse them
+            body_digest = hashlib.sha1(body).hexdigest()
+            entries = self._load_parsed_feed(rss_url, body_digest)
+            if entries is None:
+                entries = self._parse_entries(body)
+                if entries:
+                    self._save_parsed_feed(rss_url, body_digest, entries)
+
+            for entry in entries:
+                pub_date = entry['published']
+                if pub_date is None:
+                    # If no date, skip date filtering
+                    pub_date = run_now
+                elif pub_date < cutoff_date:
                     continue
 
+                papers.append(Paper(source=journal_name, **dict(entry, published=pub_date)))
+
+        except requests.exceptions.RequestException as e:
+            logger.error("  HTTP error: %s", e)
         except ParseError as e:
-            print(f"  XML parse error: {e}")
+            logger.error("  XML parse error: %s", e)
         except Exception as e:
-            print(f"  Unexpected error: {e}")
+            logger.error("  Unexpected error: %s", e)
 
         return papers
 
+    def _parse_entries(self, body: bytes) -> List[Dict[str, Any]]:
+        """Parse a feed body into paper fields, one dict per entry.
+
+        Entries are not date-filtered here, so the result can be cached and
+        reused with any cutoff. Entries without a date have published=None.
+
+        Args:
+            body: Raw feed document
+
+        Returns:
+            List of Paper keyword arguments (without source)
+        """
+        entries: List[Dict[str, Any]] = []
+
+        # HTML in summaries (including script and style contents) is stripped
+        # below, so feedparser's sanitizer and relative-URI rewriting would
+        # only be wasted work on every entry
+        feed = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+
+        # Check if feed was parsed successfully
+        if feed.bozo and not feed.entries:
+            logger.warning(
+                "  Feed may have errors: %s",
+                feed.get('bozo_exception', 'Unknown error'),
+            )
+            return entries
+
+        for entry in feed.entries:
+            try:
+                # Extract title
+                title = entry.get('title', '').strip()
+                if not title:
+                    continue
+
+                # Extract abstract/summary
+                abstract = entry.get('summary', entry.get('description', '')).strip()
+                # Remove HTML tags if present
+                if abstract and '<' in abstract:
+                    abstract = _TAG_RE.sub('', _SCRIPT_STYLE_RE.sub('', abstract)).strip()
+
+                entries.append({
+                    'title': title,
+                    'authors': self._extract_authors(entry),
+                    'abstract': abstract,
+                    'url': entry.get('link', entry.get('id', '')),
+                    'published': self._extract_date(entry),
+                    'doi': self._extract_doi(entry),
+                })
+
+            except Exception as e:
+                logger.warning("  Error parsing entry: %s", e)
+                continue
+
+        return entries
+
+    def _parsed_feed_path(self, rss_url: str) -> Path:
+        """Get the parsed-entry cache file for a feed.
+
+        Args:
+            rss_url: URL of the RSS feed
+
+        Returns:
+            Cache file path
+        """
+        return self.parsed_cache_dir / f"{hashlib.sha1(rss_url.encode()).hexdigest()}.pkl"
+
+    def _load_parsed_feed(self, rss_url: str, body_digest: str) -> Optional[List[Dict[str, Any]]]:
+        """Load cached entries if they were parsed from the same feed body.
+
+        Args:
+            rss_url: URL of the RSS feed
+            body_digest: SHA-1 hex digest of the current feed body
+
+        Returns:
+            Cached entries or None
+        """
+        if self.parsed_cache_dir is None:
+            return None
+
+        try:
+            with open(self._parsed_feed_path(rss_url), "rb") as f:
+                version, cached_digest, entries = pickle.load(f)
+        except Exception:
+            # Missing or unreadable entries are simply parsed again
+            return None
+
+        if version != _PARSED_FEED_VERSION or cached_digest != body_digest:
+            return None
+        return entries
+
+    def _save_parsed_feed(
+        self,
+        rss_url: str,
+        body_digest: str,
+        entries: List[Dict[str, Any]],
+    ) -> None:
+        """Save parsed entries together with the digest of their feed body.
+
+        Args:
+            rss_url: URL of the RSS feed
+            body_digest: SHA-1 hex digest of the feed body
+            entries: Parsed entries
+        """
+        if self.parsed_cache_dir is None:
+            return
+
+        cache_file = self._parsed_feed_path(rss_url)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.parsed_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                pickle.dump(
+                    (_PARSED_FEED_VERSION, body_digest, entries),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning("  Could not write parsed feed cache: %s", e)
+
     def _extract_date(self, entry: feedparser.FeedParserDict) -> Optional[datetime]:
         """Extract publication date from RSS entry.
 
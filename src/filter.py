@@ -1,8 +1,37 @@
 """Paper filtering and relevance scoring."""
 
-import re
+import sys
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any, Dict, List, Optional, Tuple
 
+# Joins paper texts into one corpus; must not be a word character
+_TEXT_SEPARATOR = '\x01'
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex \\b.
+
+    Args:
+        char: Single character
+
+    Returns:
+        True if the character is alphanumeric or an underscore
+    """
+    return char.isalnum() or char == '_'
+
+
+def _negated_score(paper: Any) -> int:
+    """Sort key that orders papers by descending relevance score.
+
+    Args:
+        paper: Paper object with relevance_score attribute
+
+    Returns:
+        Negated relevance score
+    """
+    return -paper.relevance_score
+
 
 class PaperFilter:
     """Filters and scores papers based on keyword relevance."""
@@ -18,11 +47,33 @@ class PaperFilter:
             primary_keywords: Primary keywords for matching (weighted higher)
             secondary_keywords: Secondary keywords for matching (weighted lower)
         """
-        self.primary_keywords = [kw.lower() for kw in primary_keywords]
+        # Keywords are interned so every match and report shares one object
+        self.primary_keywords = [sys.intern(kw.lower()) for kw in primary_keywords]
         self.secondary_keywords = (
-            [kw.lower() for kw in secondary_keywords] if secondary_keywords else []
+            [sys.intern(kw.lower()) for kw in secondary_keywords] if secondary_keywords else []
         )
 
+        # Scoring weights per distinct keyword, in report order: primary
+        # keywords are worth 10 points per match, secondary keywords 3
+        self._weighted_keywords: List[Tuple[str, int]] = [
+            (keyword, 10) for keyword in dict.fromkeys(self.primary_keywords)
+        ] + [(keyword, 3) for keyword in dict.fromkeys(self.secondary_keywords)]
+
+        # Total points per match of each keyword (a keyword listed as both
+        # primary and secondary earns both weights)
+        self._keyword_weights: Dict[str, int] = {}
+        for keyword, weight in self._weighted_keywords:
+            self._keyword_weights[keyword] = self._keyword_weights.get(keyword, 0) + weight
+
+        # Each distinct keyword with whether its first and last characters are
+        # word characters, which decides what a word boundary next to it means
+        all_keywords = self.primary_keywords + self.secondary_keywords
+        self._keyword_edges: List[Tuple[str, bool, bool]] = [
+            (keyword, _is_word_char(keyword[0]), _is_word_char(keyword[-1]))
+            for keyword in dict.fromkeys(all_keywords)
+            if keyword
+        ]
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text for matching.
 
@@ -34,25 +85,69 @@ class PaperFilter:
         """
         return text.lower()
 
-    def _count_keyword_matches(self, text: str, keywords: List[str]) -> Dict[str, int]:
+    def _searchable_text(self, paper: Any) -> str:
+        """Build the normalized text that keywords are matched against.
+
+        Args:
+            paper: Paper object with title and abstract attributes
+
+        Returns:
+            Normalized title and abstract
+        """
+        return self._normalize_text(f"{paper.title} {paper.abstract}")
+
+    def _count_keyword_matches(self, normalized_text: str) -> Dict[str, int]:
         """Count how many times each keyword appears in text.
 
         Args:
-            text: Text to search
-            keywords: List of keywords to find
+            normalized_text: Normalized text to search
 
         Returns:
             Dictionary mapping keyword to count
         """
-        normalized_text = self._normalize_text(text)
-        matches: Dict[str, int] = {}
+        return self._count_corpus_matches([normalized_text])[0]
 
-        for keyword in keywords:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            count = len(re.findall(pattern, normalized_text))
-            if count > 0:
-                matches[keyword] = count
+    def _count_corpus_matches(self, normalized_texts: List[str]) -> List[Dict[str, int]]:
+        """Count keyword occurrences in many texts at once.
+
+        Matches follow word-boundary regex semantics: each keyword counts
+        non-overlapping occurrences with a word boundary on both sides.
+
+        Args:
+            normalized_texts: Normalized texts to search
+
+        Returns:
+            One dictionary mapping keyword to count per text
+        """
+        matches: List[Dict[str, int]] = [{} for _ in normalized_texts]
+        if not self._keyword_edges or not normalized_texts:
+            return matches
+
+        # The separator is a non-word character, so no keyword match can span
+        # two texts and word boundaries behave as at the ends of each text
+        corpus = _TEXT_SEPARATOR.join(normalized_texts)
+        text_starts = list(accumulate((len(text) + 1 for text in normalized_texts[:-1]), initial=0))
+        corpus_length = len(corpus)
+
+        # str.find runs CPython's C substring search, which is much faster than
+        # a regex pass; only actual occurrences are checked for word boundaries
+        for keyword, starts_with_word_char, ends_with_word_char in self._keyword_edges:
+            length = len(keyword)
+            start = corpus.find(keyword)
+            while start != -1:
+                end = start + length
+                preceded_by_word_char = start > 0 and _is_word_char(corpus[start - 1])
+                followed_by_word_char = end < corpus_length and _is_word_char(corpus[end])
+                if (
+                    preceded_by_word_char != starts_with_word_char
+                    and followed_by_word_char != ends_with_word_char
+                ):
+                    text_matches = matches[bisect_right(text_starts, start) - 1]
+                    text_matches[keyword] = text_matches.get(keyword, 0) + 1
+                    # Matches of one keyword never overlap
+                    start = corpus.find(keyword, end)
+                else:
+                    start = corpus.find(keyword, start + 1)
 
         return matches
 
@@ -65,28 +160,24 @@ class PaperFilter:
         Returns:
             Tuple of (score, matched_keywords)
         """
-        # Combine title and abstract for searching
-        searchable_text = f"{paper.title} {paper.abstract}"
+        return self._score_matches(self._count_keyword_matches(self._searchable_text(paper)))
 
-        # Find matches
-        primary_matches = self._count_keyword_matches(searchable_text, self.primary_keywords)
-        secondary_matches = self._count_keyword_matches(
-            searchable_text, self.secondary_keywords
-        )
+    def _score_matches(self, matches: Dict[str, int]) -> Tuple[int, List[str]]:
+        """Score keyword match counts.
 
-        # Calculate score
-        # Primary keywords worth 10 points each
-        # Secondary keywords worth 3 points each
-        score = 0
-        matched_keywords: List[str] = []
+        Args:
+            matches: Dictionary mapping keyword to count
 
-        for keyword, count in primary_matches.items():
-            score += count * 10
-            matched_keywords.append(keyword)
+        Returns:
+            Tuple of (score, matched_keywords)
+        """
+        # Most papers match nothing, so skip the keyword walk for them
+        if not matches:
+            return 0, []
 
-        for keyword, count in secondary_matches.items():
-            score += count * 3
-            matched_keywords.append(keyword)
+        keyword_weights = self._keyword_weights
+        score = sum(count * keyword_weights[keyword] for keyword, count in matches.items())
+        matched_keywords = [keyword for keyword, _ in self._weighted_keywords if keyword in matches]
 
         return score, matched_keywords
 
@@ -104,18 +195,22 @@ class PaperFilter:
         Returns:
             Filtered list of papers with scores and matched keywords
         """
-        filtered_papers = []
-
-        for paper in papers:
-            score, matched_keywords = self.score_paper(paper)
+        # Build the searchable text column, then match the whole corpus at once
+        texts = [self._searchable_text(paper) for paper in papers]
+        corpus_matches = self._count_corpus_matches(texts)
+        results = [self._score_matches(matches) for matches in corpus_matches]
+        scores = [score for score, _ in results]
 
-            if score >= min_score:
-                paper.relevance_score = score
-                paper.matched_keywords = matched_keywords
-                filtered_papers.append(paper)
+        # Sort the indices of passing papers by score (highest first); the
+        # sort is stable, so ties keep their fetch order
+        keep = [index for index, score in enumerate(scores) if score >= min_score]
+        keep.sort(key=scores.__getitem__, reverse=True)
 
-        # Sort by relevance score (highest first)
-        filtered_papers.sort(key=lambda p: p.relevance_score, reverse=True)
+        filtered_papers = []
+        for index in keep:
+            paper = papers[index]
+            paper.relevance_score, paper.matched_keywords = results[index]
+            filtered_papers.append(paper)
 
         return filtered_papers
 
@@ -126,25 +221,19 @@ class PaperFilter:
         """Group papers by relevance level.
 
         Args:
-            papers: List of paper objects with relevance_score attribute
+            papers: List of paper objects sorted by relevance_score (highest
+                first), as returned by filter_papers
 
         Returns:
             Dictionary with 'high', 'medium', 'low' relevance groups
         """
-        groups: Dict[str, List[Any]] = {
-            "high": [],
-            "medium": [],
-            "low": [],
+        # Scores are descending, so each group is a contiguous slice; negating
+        # the score gives the ascending key that bisect needs
+        high_end = bisect_right(papers, -20, key=_negated_score)
+        medium_end = bisect_right(papers, -10, lo=high_end, key=_negated_score)
+
+        return {
+            "high": papers[:high_end],
+            "medium": papers[high_end:medium_end],
+            "low": papers[medium_end:],
         }
-
-        for paper in papers:
-            score = paper.relevance_score
-
-            if score >= 20:
-                groups["high"].append(paper)
-            elif score >= 10:
-                groups["medium"].append(paper)
-            else:
-                groups["low"].append(paper)
-
-        return groups
@@ -1,10 +1,167 @@
 """LLM-based paper relevance scoring using Aliyun DashScope or Azure OpenAI."""
 
+import asyncio
 import hashlib
 import json
+import math
+import operator
 import os
+import random
+import sqlite3
+import time
+from collections import OrderedDict
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+# Prefer orjson for cache payloads; it encodes straight to compact UTF-8 bytes
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+DASHSCOPE_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+AZURE_API_VERSION = "2024-08-01-preview"
+# Qwen3-based models otherwise spend output tokens and latency on reasoning
+DASHSCOPE_EXTRA_BODY = {"enable_thinking": False}
+SYSTEM_MESSAGE = "You are an expert research assistant. Respond only with valid JSON."
+# Inputs per embeddings request (DashScope accepts at most 10, OpenAI up to 2048)
+EMBEDDING_BATCH_SIZE = {"dashscope": 10, "azure": 256}
+# Score thresholds of the 'high' and 'medium' relevance groups
+HIGH_RELEVANCE_SCORE = 75
+MEDIUM_RELEVANCE_SCORE = 50
+# About 500 tokens: enough to judge relevance; longer abstracts only add cost
+MAX_ABSTRACT_CHARS = 2000
+# Prompts are the header with the research interests, the paper section and
+# a fixed suffix; only the paper section changes from call to call
+PROMPT_HEADER = """You are an expert research assistant helping to filter academic papers.
+
+Research Interests:
+"""
+PROMPT_SUFFIX = """
+
+Task: Determine if this paper is relevant to the research interests above.
+
+Respond with a JSON object with the following fields:
+- "relevant": boolean (true if relevant, false if not)
+- "confidence": string ("high", "medium", "low")
+- "score": integer (0-100, where 100 is highly relevant)
+- "reasoning": string (brief explanation of why this paper is or isn't relevant)
+- "topics": list of strings (key topics from the paper that relate to research interests)
+
+Only respond with the JSON object, no additional text."""
+BATCH_PROMPT_SUFFIX = """
+
+Task: Determine for each paper whether it is relevant to the research interests above.
+
+Respond with a JSON object with a single field "results": a list with one object per paper, \
+each with the following fields:
+- "id": integer (the id of the paper being evaluated)
+- "relevant": boolean (true if relevant, false if not)
+- "confidence": string ("high", "medium", "low")
+- "score": integer (0-100, where 100 is highly relevant)
+- "reasoning": string (brief explanation of why this paper is or isn't relevant)
+- "topics": list of strings (key topics from the paper that relate to research interests)
+
+Only respond with the JSON object, no additional text."""
+DECISION_FIELDS = ("relevant", "score", "confidence", "reasoning")
+BATCH_API_TERMINAL_STATES = ("completed", "failed", "expired", "cancelled")
+CACHE_DB_NAME = "cache.db"
+LEGACY_CACHE_FILE_NAME = "decisions.jsonl"
+CACHE_FLUSH_INTERVAL = 5.0
+MAX_CACHE_SIZE_MB = 100.0
+MEMORY_CACHE_SIZE = 4096
+# HTTP/2 lets concurrent requests share one connection instead of opening one
+# each; httpx only supports it when the optional h2 package is installed
+HTTP2_AVAILABLE = find_spec("h2") is not None
+# Transient API errors are retried with exponential backoff; the clients'
+# own retries are disabled so that all retrying happens here
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _truncate_abstract(abstract: str) -> str:
+    """Shorten an abstract to MAX_ABSTRACT_CHARS, cutting at a word boundary.
+
+    Args:
+        abstract: Paper abstract
+
+    Returns:
+        Abstract, shortened with a trailing "..." if it was too long
+    """
+    if len(abstract) <= MAX_ABSTRACT_CHARS:
+        return abstract
+    return abstract[:MAX_ABSTRACT_CHARS].rsplit(" ", 1)[0] + "..."
+
+
+def _is_valid_decision(decision: Any) -> bool:
+    """Check that a decision has every field scoring relies on, with usable types.
+
+    Args:
+        decision: Decision parsed from an LLM response or the cache
+
+    Returns:
+        True if the decision is a dict with all DECISION_FIELDS, a bool
+        'relevant' and a numeric 'score'
+    """
+    if not isinstance(decision, dict) or not all(k in decision for k in DECISION_FIELDS):
+        return False
+    # bool is an int subclass, so a boolean score is rejected explicitly
+    score = decision["score"]
+    return (
+        isinstance(decision["relevant"], bool)
+        and isinstance(score, (int, float))
+        and not isinstance(score, bool)
+    )
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Compute the cosine similarity of two vectors.
+
+    Args:
+        a: First vector
+        b: Second vector
+
+    Returns:
+        Cosine similarity, 0.0 if either vector is zero
+    """
+    norm = math.sqrt(sum(map(operator.mul, a, a)) * sum(map(operator.mul, b, b)))
+    if norm == 0:
+        return 0.0
+    return sum(map(operator.mul, a, b)) / norm
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Compute how long to wait before retrying a failed API call.
+
+    Args:
+        attempt: Number of the failed attempt, starting at 0
+        error: Error raised by the attempt
+
+    Returns:
+        Seconds to wait: exponential backoff with jitter, or longer if the
+        server asked for it with a Retry-After header
+    """
+    delay = RETRY_BASE_DELAY * 2 ** attempt + random.random()
+    if isinstance(error, APIStatusError):
+        try:
+            delay = max(delay, float(error.response.headers.get("retry-after", 0)))
+        except ValueError:
+            pass
+    return delay
 
 
 class LLMPaperScorer:
@@ -17,6 +174,13 @@ class LLMPaperScorer:
         research_interests: str,
         provider: str = "dashscope",
         cache_dir: str = ".cache/llm_decisions",
+        max_concurrency: int = 16,
+        papers_per_request: int = 5,
+        use_batch_api: bool = False,
+        batch_poll_interval: float = 30.0,
+        max_cache_mb: float = MAX_CACHE_SIZE_MB,
+        embedding_model: Optional[str] = None,
+        prefilter_top_k: int = 0,
     ):
         """Initialize LLM scorer.
 
@@ -26,21 +190,62 @@ class LLMPaperScorer:
             research_interests: Description of research interests
             provider: 'dashscope' or 'azure'
             cache_dir: Directory to cache LLM decisions
+            max_concurrency: Maximum number of LLM requests in flight at once
+            papers_per_request: Number of uncached papers packed into one prompt.
+                Larger batches save prompt tokens and requests, but each
+                response takes longer, so gains flatten out beyond ~5-10.
+            use_batch_api: Score uncached papers through the provider's Batch API
+                (about half the price, no per-minute request limits, but results
+                may take hours). Only supported for Azure; ignored for DashScope.
+            batch_poll_interval: Seconds between Batch API job status checks
+            max_cache_mb: Size limit of the cached decisions in MB; the oldest
+                entries are evicted beyond it (0 or less for no limit)
+            embedding_model: Embedding model (DashScope) or deployment (Azure)
+                used by the prefilter
+            prefilter_top_k: If positive and embedding_model is set, only the
+                uncached papers most similar to the research interests, up to
+                this many, are sent to the LLM; the rest are scored 0
         """
         self.api_key = api_key
         self.model = model
         self.provider = provider
         self.research_interests = research_interests
+        # Everything before the paper section is the same for every prompt
+        self._prompt_prefix = f"{PROMPT_HEADER}{research_interests}\n\nPaper to Evaluate:\n"
+        self._batch_prompt_prefix = (
+            f"{PROMPT_HEADER}{research_interests}\n\nPapers to Evaluate (JSON list):\n"
+        )
+        self.max_concurrency = max_concurrency
+        self.papers_per_request = max(1, papers_per_request)
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.embedding_model = embedding_model
+        self.prefilter_top_k = prefilter_top_k
+        self._interest_embedding: Optional[List[float]] = None
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # All decisions live in one SQLite database; new decisions are
+        # written in batches, one transaction per flush
+        self._db = self._open_cache_db()
+        self._pending: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # Recently used decisions, so repeated lookups skip the database
+        self._mem_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._last_flush = time.monotonic()
+        self._migrate_legacy_cache()
+        self.max_cache_bytes = int(max_cache_mb * 1024 * 1024)
+        self._cache_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(key) + LENGTH(payload)), 0) FROM decisions"
+        ).fetchone()[0]
+
         # Initialize client based on provider
         if provider == "dashscope":
             from openai import OpenAI
             # DashScope uses OpenAI-compatible API
             self.client = OpenAI(
                 api_key=api_key,
-                base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
+                base_url=DASHSCOPE_BASE_URL,
+                max_retries=0,
             )
         elif provider == "azure":
             from openai import AzureOpenAI
@@ -52,7 +257,8 @@ class LLMPaperScorer:
             self.client = AzureOpenAI(
                 azure_endpoint=self.azure_endpoint,
                 api_key=api_key,
-                api_version="2024-08-01-preview",
+                api_version=AZURE_API_VERSION,
+                max_retries=0,
             )
 
         # Statistics
@@ -60,6 +266,41 @@ class LLMPaperScorer:
         self.cache_misses = 0
         self.api_calls = 0
 
+    def _create_async_client(self) -> Any:
+        """Create an async client for the configured provider.
+
+        A new client is created for every batch, since its connection pool is
+        bound to the event loop that runs the batch. All requests of the batch
+        share the pool, over HTTP/2 when available.
+
+        Returns:
+            AsyncOpenAI or AsyncAzureOpenAI client
+        """
+        from openai import DefaultAsyncHttpxClient
+
+        # Keeps the SDK's default timeouts and pool limits, which already
+        # allow far more connections than max_concurrency
+        http_client = DefaultAsyncHttpxClient(http2=HTTP2_AVAILABLE)
+
+        if self.provider == "dashscope":
+            from openai import AsyncOpenAI
+            return AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=DASHSCOPE_BASE_URL,
+                max_retries=0,
+                http_client=http_client,
+            )
+        elif self.provider == "azure":
+            from openai import AsyncAzureOpenAI
+            return AsyncAzureOpenAI(
+                azure_endpoint=self.azure_endpoint,
+                api_key=self.api_key,
+                api_version=AZURE_API_VERSION,
+                max_retries=0,
+                http_client=http_client,
+            )
+        raise ValueError(f"Unknown provider: {self.provider}")
+
     def _get_cache_key(self, title: str, abstract: str) -> str:
         """Generate cache key from paper title and abstract.
 
@@ -73,6 +314,137 @@ class LLMPaperScorer:
         content = f"{title}|{abstract}"
         return hashlib.md5(content.encode()).hexdigest()
 
+    def _open_cache_db(self) -> sqlite3.Connection:
+        """Open the cache database, creating the table if needed.
+
+        Returns:
+            SQLite connection
+        """
+        db = sqlite3.connect(self.cache_dir / CACHE_DB_NAME)
+        # WAL with synchronous=NORMAL makes each commit an append to the log
+        # without an fsync; a crash can at worst lose the last few decisions
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            "key TEXT PRIMARY KEY, cached_at INTEGER NOT NULL, payload BLOB NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS decisions_cached_at ON decisions (cached_at)")
+        db.commit()
+        return db
+
+    def _migrate_legacy_cache(self) -> None:
+        """Import decisions from older cache formats, then remove those files.
+
+        Older versions wrote one JSON file per decision, and later one
+        decisions.jsonl file for all of them.
+        """
+        from datetime import datetime
+
+        legacy: Dict[str, Dict[str, Any]] = {}
+
+        # A single open() both checks for and reads the file on every start
+        jsonl_file = self.cache_dir / LEGACY_CACHE_FILE_NAME
+        try:
+            with open(jsonl_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        legacy[entry.pop("key")] = entry
+                    except (ValueError, KeyError, AttributeError):
+                        # Skip a partially written line
+                        continue
+            found_jsonl = True
+        except FileNotFoundError:
+            found_jsonl = False
+
+        legacy_files = list(self.cache_dir.glob("*.json"))
+        for cache_file in legacy_files:
+            try:
+                with open(cache_file) as f:
+                    legacy.setdefault(cache_file.stem, json.load(f))
+            except (OSError, ValueError):
+                pass
+
+        if not legacy and not found_jsonl:
+            return
+
+        rows = []
+        now = int(time.time())
+        for cache_key, decision in legacy.items():
+            try:
+                cached_at = int(datetime.fromisoformat(decision.pop("cached_at")).timestamp())
+            except (KeyError, TypeError, ValueError):
+                cached_at = now
+            rows.append((cache_key, cached_at, _json_dumps(decision)))
+
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO decisions (key, cached_at, payload) VALUES (?, ?, ?)",
+                rows,
+            )
+        jsonl_file.unlink(missing_ok=True)
+        for cache_file in legacy_files:
+            cache_file.unlink(missing_ok=True)
+
+    def flush_cache(self) -> None:
+        """Write decisions saved since the last flush to the cache database."""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [
+            (cache_key, cached_at, _json_dumps(decision))
+            for cache_key, (cached_at, decision) in pending.items()
+        ]
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO decisions (key, cached_at, payload) VALUES (?, ?, ?)",
+                    rows,
+                )
+                # Replaced entries are counted twice, so the estimate errs high
+                self._cache_bytes += sum(len(key) + len(payload) for key, _, payload in rows)
+                if 0 < self.max_cache_bytes < self._cache_bytes:
+                    self._evict_oldest()
+        except sqlite3.Error as e:
+            print(f"  Warning: Could not write LLM cache: {e}")
+
+    def _evict_oldest(self) -> None:
+        """Delete the oldest cache entries until the cache is under its size limit.
+
+        Evicts down to 90% of the limit, so the next few flushes do not each
+        trigger another eviction.
+        """
+        target = self.max_cache_bytes * 9 // 10
+        size = self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(key) + LENGTH(payload)), 0) FROM decisions"
+        ).fetchone()[0]
+
+        evicted = []
+        # Walks the cached_at index from the oldest entry and stops early
+        rows = self._db.execute(
+            "SELECT key, LENGTH(key) + LENGTH(payload) FROM decisions ORDER BY cached_at"
+        )
+        for cache_key, entry_size in rows:
+            if size <= target:
+                break
+            evicted.append((cache_key,))
+            size -= entry_size
+        rows.close()
+
+        self._db.executemany("DELETE FROM decisions WHERE key = ?", evicted)
+        self._cache_bytes = size
+
+    def __del__(self) -> None:
+        """Flush pending cache writes when the scorer is discarded."""
+        try:
+            self.flush_cache()
+            self._db.close()
+        except Exception:
+            pass
+
     def _load_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Load decision from cache.
 
@@ -82,33 +454,58 @@ class LLMPaperScorer:
         Returns:
             Cached decision or None
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            with open(cache_file) as f:
-                self.cache_hits += 1
-                return json.load(f)
-        return None
+        decision = self._mem_cache.get(cache_key)
+        if decision is not None:
+            self._mem_cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return decision
+
+        pending = self._pending.get(cache_key)
+        if pending is not None:
+            self.cache_hits += 1
+            return pending[1]
+
+        row = self._db.execute(
+            "SELECT payload FROM decisions WHERE key = ?", (cache_key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        decision = _json_loads(row[0])
+        # Treat an incomplete or mistyped entry as a miss; it is replaced once rescored
+        if not _is_valid_decision(decision):
+            return None
+
+        self.cache_hits += 1
+        self._remember(cache_key, decision)
+        return decision
+
+    def _remember(self, cache_key: str, decision: Dict[str, Any]) -> None:
+        """Add a decision to the in-memory LRU cache.
+
+        Args:
+            cache_key: Cache key
+            decision: Decision to keep in memory
+        """
+        self._mem_cache[cache_key] = decision
+        self._mem_cache.move_to_end(cache_key)
+        if len(self._mem_cache) > MEMORY_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
 
     def _save_to_cache(self, cache_key: str, decision: Dict[str, Any]) -> None:
         """Save decision to cache with timestamp.
 
+        The decision is available immediately; the database is written at
+        most every CACHE_FLUSH_INTERVAL seconds, and by flush_cache().
+
         Args:
             cache_key: Cache key
             decision: Decision to cache
         """
-        from datetime import datetime
-
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        # Add timestamp and compact format to save space
-        cache_data = {
-            **decision,
-            "cached_at": datetime.now().isoformat(),
-        }
-
-        # Use compact JSON format (no indentation) to save disk space
-        with open(cache_file, "w") as f:
-            json.dump(cache_data, f, separators=(',', ':'))
+        self._pending[cache_key] = (int(time.time()), decision)
+        self._remember(cache_key, decision)
+        if time.monotonic() - self._last_flush >= CACHE_FLUSH_INTERVAL:
+            self.flush_cache()
 
     def clean_old_cache(self, days: int = 90) -> int:
         """Remove cache entries older than specified days.
@@ -117,27 +514,20 @@ class LLMPaperScorer:
             days: Number of days to keep (default: 90)
 
         Returns:
-            Number of cache files removed
+            Number of cache entries removed
         """
-        from datetime import datetime, timedelta
+        self.flush_cache()
+        self._mem_cache.clear()
+        cutoff = int(time.time()) - days * 86400
 
-        cutoff_date = datetime.now() - timedelta(days=days)
-        removed_count = 0
-
-        for cache_file in self.cache_dir.glob("*.json"):
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    if "cached_at" in data:
-                        cached_time = datetime.fromisoformat(data["cached_at"])
-                        if cached_time < cutoff_date:
-                            cache_file.unlink()
-                            removed_count += 1
-            except Exception:
-                # Skip problematic cache files
-                pass
+        # A range scan on the cached_at index; no entry is read or parsed
+        with self._db:
+            cursor = self._db.execute("DELETE FROM decisions WHERE cached_at < ?", (cutoff,))
+            self._cache_bytes = self._db.execute(
+                "SELECT COALESCE(SUM(LENGTH(key) + LENGTH(payload)), 0) FROM decisions"
+            ).fetchone()[0]
 
-        return removed_count
+        return cursor.rowcount
 
     def _create_prompt(self, title: str, abstract: str, source: str) -> str:
         """Create prompt for LLM.
@@ -153,30 +543,78 @@ class LLMPaperScorer:
         # Build paper info using whatever is available
         paper_info = f"Source: {source}\nTitle: {title}"
         if abstract and abstract.strip():
-            paper_info += f"\nAbstract: {abstract}"
+            paper_info += f"\nAbstract: {_truncate_abstract(abstract)}"
         else:
             paper_info += "\nAbstract: [Not available - please evaluate based on title only]"
 
-        prompt = f"""You are an expert research assistant helping to filter academic papers.
+        # One f-string builds the result in a single allocation
+        return f"{self._prompt_prefix}{paper_info}{PROMPT_SUFFIX}"
 
-Research Interests:
-{self.research_interests}
+    def _create_batch_prompt(self, papers: List[Any]) -> str:
+        """Create one prompt that asks for decisions on several papers.
 
-Paper to Evaluate:
-{paper_info}
+        The research interests and instructions are sent once for the whole
+        batch instead of once per paper.
 
-Task: Determine if this paper is relevant to the research interests above.
+        Args:
+            papers: Paper objects with title, abstract, source
 
-Respond with a JSON object with the following fields:
-- "relevant": boolean (true if relevant, false if not)
-- "confidence": string ("high", "medium", "low")
-- "score": integer (0-100, where 100 is highly relevant)
-- "reasoning": string (brief explanation of why this paper is or isn't relevant)
-- "topics": list of strings (key topics from the paper that relate to research interests)
+        Returns:
+            Formatted prompt
+        """
+        paper_rows = [
+            {
+                "id": i,
+                "source": paper.source,
+                "title": paper.title,
+                "abstract": _truncate_abstract((paper.abstract or "").strip())
+                or "[Not available - please evaluate based on title only]",
+            }
+            for i, paper in enumerate(papers)
+        ]
+
+        paper_list = json.dumps(paper_rows, ensure_ascii=False)
+        return f"{self._batch_prompt_prefix}{paper_list}{BATCH_PROMPT_SUFFIX}"
+
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a prompt.
 
-Only respond with the JSON object, no additional text."""
+        Args:
+            prompt: Prompt to send
+
+        Returns:
+            Chat messages
+        """
+        return [
+            {"role": "system", "content": SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt},
+        ]
 
-        return prompt
+    def _parse_json_content(self, content: str) -> Dict[str, Any]:
+        """Parse the JSON object in a model response.
+
+        Args:
+            content: Response message content
+
+        Returns:
+            Parsed JSON response
+        """
+        # Try to extract JSON from response
+        try:
+            return json.loads(content)
+        except json.JSONDecodeError:
+            pass
+
+        # Find the first complete JSON object in surrounding text: decode at
+        # each "{" and ignore whatever follows the object
+        decoder = json.JSONDecoder()
+        start = content.find("{")
+        while start != -1:
+            try:
+                return decoder.raw_decode(content, start)[0]
+            except json.JSONDecodeError:
+                start = content.find("{", start + 1)
+        raise ValueError(f"Could not parse JSON from response: {content}")
 
     def _call_dashscope(self, prompt: str) -> Dict[str, Any]:
         """Call Aliyun DashScope API via OpenAI-compatible endpoint.
@@ -189,28 +627,14 @@ Only respond with the JSON object, no additional text."""
         """
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert research assistant. Respond only with valid JSON.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(prompt),
             temperature=0.1,
             max_tokens=300,
+            response_format={"type": "json_object"},
+            extra_body=DASHSCOPE_EXTRA_BODY,
         )
 
-        content = response.choices[0].message.content
-        # Try to extract JSON from response
-        try:
-            return json.loads(content)
-        except json.JSONDecodeError:
-            # Try to find JSON in the response
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            raise ValueError(f"Could not parse JSON from response: {content}")
+        return self._parse_json_content(response.choices[0].message.content)
 
     def _call_azure(self, prompt: str) -> Dict[str, Any]:
         """Call Azure OpenAI API.
@@ -223,13 +647,49 @@ Only respond with the JSON object, no additional text."""
         """
         response = self.client.chat.completions.create(
             model=self.azure_deployment,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert research assistant. Respond only with valid JSON.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=self._build_messages(prompt),
+            temperature=0.1,
+            max_tokens=300,
+            response_format={"type": "json_object"},
+        )
+
+        content = response.choices[0].message.content
+        return json.loads(content)
+
+    async def _call_dashscope_async(self, client: Any, prompt: str) -> Dict[str, Any]:
+        """Call Aliyun DashScope API asynchronously.
+
+        Args:
+            client: Async client from _create_async_client
+            prompt: Prompt to send
+
+        Returns:
+            Parsed JSON response
+        """
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            temperature=0.1,
+            max_tokens=300,
+            response_format={"type": "json_object"},
+            extra_body=DASHSCOPE_EXTRA_BODY,
+        )
+
+        return self._parse_json_content(response.choices[0].message.content)
+
+    async def _call_azure_async(self, client: Any, prompt: str) -> Dict[str, Any]:
+        """Call Azure OpenAI API asynchronously.
+
+        Args:
+            client: Async client from _create_async_client
+            prompt: Prompt to send
+
+        Returns:
+            Parsed JSON response
+        """
+        response = await client.chat.completions.create(
+            model=self.azure_deployment,
+            messages=self._build_messages(prompt),
             temperature=0.1,
             max_tokens=300,
             response_format={"type": "json_object"},
@@ -238,6 +698,149 @@ Only respond with the JSON object, no additional text."""
         content = response.choices[0].message.content
         return json.loads(content)
 
+    def _parse_batch_decisions(self, data: Any) -> Dict[int, Dict[str, Any]]:
+        """Split a batch response into per-paper decisions.
+
+        Args:
+            data: Parsed JSON response, {"results": [...]} or a bare list
+
+        Returns:
+            Dictionary mapping paper id to its decision; malformed entries are skipped
+        """
+        if isinstance(data, dict):
+            data = data.get("results", [])
+
+        decisions: Dict[int, Dict[str, Any]] = {}
+        for item in data if isinstance(data, list) else []:
+            if not _is_valid_decision(item):
+                continue
+            try:
+                paper_id = int(item.pop("id"))
+            except (KeyError, TypeError, ValueError):
+                continue
+            decisions[paper_id] = item
+        return decisions
+
+    async def _call_dashscope_batch(
+        self,
+        client: Any,
+        prompt: str,
+        num_papers: int,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Call Aliyun DashScope API with a multi-paper prompt.
+
+        Args:
+            client: Async client from _create_async_client
+            prompt: Prompt from _create_batch_prompt
+            num_papers: Number of papers in the prompt
+
+        Returns:
+            Dictionary mapping paper id to its decision
+        """
+        response = await client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            temperature=0.1,
+            max_tokens=300 * num_papers,
+            response_format={"type": "json_object"},
+            extra_body=DASHSCOPE_EXTRA_BODY,
+        )
+
+        content = response.choices[0].message.content
+        return self._parse_batch_decisions(self._parse_json_content(content))
+
+    async def _call_azure_batch(
+        self,
+        client: Any,
+        prompt: str,
+        num_papers: int,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Call Azure OpenAI API with a multi-paper prompt.
+
+        Args:
+            client: Async client from _create_async_client
+            prompt: Prompt from _create_batch_prompt
+            num_papers: Number of papers in the prompt
+
+        Returns:
+            Dictionary mapping paper id to its decision
+        """
+        response = await client.chat.completions.create(
+            model=self.azure_deployment,
+            messages=self._build_messages(prompt),
+            temperature=0.1,
+            max_tokens=300 * num_papers,
+            response_format={"type": "json_object"},
+        )
+
+        content = response.choices[0].message.content
+        return self._parse_batch_decisions(json.loads(content))
+
+    def _call_with_retry(self, call: Callable[[], Any]) -> Any:
+        """Run an API call, retrying transient errors with exponential backoff.
+
+        Args:
+            call: Function that performs the API call
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: The last error, if all attempts fail or the error is
+                not transient
+        """
+        for attempt in range(MAX_RETRIES):
+            try:
+                return call()
+            except RETRYABLE_ERRORS as e:
+                time.sleep(_retry_delay(attempt, e))
+        return call()
+
+    async def _call_with_retry_async(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await an API call, retrying transient errors with exponential backoff.
+
+        Args:
+            call: Function that returns the API call's awaitable
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: The last error, if all attempts fail or the error is
+                not transient
+        """
+        for attempt in range(MAX_RETRIES):
+            try:
+                return await call()
+            except RETRYABLE_ERRORS as e:
+                await asyncio.sleep(_retry_delay(attempt, e))
+        return await call()
+
+    def _decision_to_result(
+        self,
+        decision: Dict[str, Any],
+        cached: bool,
+    ) -> Tuple[bool, int, Dict[str, Any]]:
+        """Convert an LLM decision into a scoring result.
+
+        Args:
+            decision: Decision from the LLM or the cache
+            cached: Whether the decision came from the cache
+
+        Returns:
+            Tuple of (is_relevant, score, metadata)
+        """
+        return (
+            decision["relevant"],
+            decision["score"],
+            {
+                "confidence": decision["confidence"],
+                "reasoning": decision["reasoning"],
+                "topics": decision.get("topics", []),
+                "cached": cached,
+            },
+        )
+
     def score_paper(self, paper: Any) -> Tuple[bool, int, Dict[str, Any]]:
         """Score a paper using LLM.
 
@@ -253,16 +856,7 @@ Only respond with the JSON object, no additional text."""
         # Check cache first
         cached = self._load_from_cache(cache_key)
         if cached:
-            return (
-                cached["relevant"],
-                cached["score"],
-                {
-                    "confidence": cached["confidence"],
-                    "reasoning": cached["reasoning"],
-                    "topics": cached.get("topics", []),
-                    "cached": True,
-                },
-            )
+            return self._decision_to_result(cached, cached=True)
 
         self.cache_misses += 1
 
@@ -277,31 +871,320 @@ Only respond with the JSON object, no additional text."""
             self.api_calls += 1
 
             if self.provider == "dashscope":
-                decision = self._call_dashscope(prompt)
+                decision = self._call_with_retry(lambda: self._call_dashscope(prompt))
             elif self.provider == "azure":
-                decision = self._call_azure(prompt)
+                decision = self._call_with_retry(lambda: self._call_azure(prompt))
             else:
                 raise ValueError(f"Unknown provider: {self.provider}")
 
+            if not _is_valid_decision(decision):
+                raise ValueError(f"LLM response is not a valid decision: {decision}")
+
             # Save to cache
             self._save_to_cache(cache_key, decision)
 
-            return (
-                decision["relevant"],
-                decision["score"],
-                {
-                    "confidence": decision["confidence"],
-                    "reasoning": decision["reasoning"],
-                    "topics": decision.get("topics", []),
-                    "cached": False,
-                },
+            return self._decision_to_result(decision, cached=False)
+
+        except Exception as e:
+            print(f"  Warning: LLM API error for paper '{paper.title[:50]}...': {e}")
+            # Return neutral score on error
+            return False, 0, {"error": str(e), "cached": False}
+
+    async def _score_paper_async(
+        self,
+        client: Any,
+        paper: Any,
+        cache_key: str,
+    ) -> Tuple[bool, int, Dict[str, Any]]:
+        """Score a paper that is not in the cache using the async client.
+
+        Args:
+            client: Async client from _create_async_client
+            paper: Paper object with title, abstract, source
+            cache_key: Cache key for the paper
+
+        Returns:
+            Tuple of (is_relevant, score, metadata)
+        """
+        try:
+            prompt = self._create_prompt(
+                paper.title,
+                paper.abstract or "",
+                paper.source
             )
 
+            self.api_calls += 1
+
+            if self.provider == "dashscope":
+                decision = await self._call_with_retry_async(
+                    lambda: self._call_dashscope_async(client, prompt)
+                )
+            elif self.provider == "azure":
+                decision = await self._call_with_retry_async(
+                    lambda: self._call_azure_async(client, prompt)
+                )
+            else:
+                raise ValueError(f"Unknown provider: {self.provider}")
+
+            if not _is_valid_decision(decision):
+                raise ValueError(f"LLM response is not a valid decision: {decision}")
+
+            # Save to cache
+            self._save_to_cache(cache_key, decision)
+
+            return self._decision_to_result(decision, cached=False)
+
         except Exception as e:
             print(f"  Warning: LLM API error for paper '{paper.title[:50]}...': {e}")
             # Return neutral score on error
             return False, 0, {"error": str(e), "cached": False}
 
+    async def _score_batch_async(
+        self,
+        client: Any,
+        papers: List[Any],
+        cache_keys: List[str],
+    ) -> List[Tuple[bool, int, Dict[str, Any]]]:
+        """Score several uncached papers with one multi-paper request.
+
+        Papers missing from the response, or all papers if the request
+        fails, are scored individually instead.
+
+        Args:
+            client: Async client from _create_async_client
+            papers: Paper objects that are not in the cache
+            cache_keys: Cache key for each paper
+
+        Returns:
+            Tuple of (is_relevant, score, metadata) for each paper, in input order
+        """
+        if len(papers) == 1:
+            return [await self._score_paper_async(client, papers[0], cache_keys[0])]
+
+        decisions: Dict[int, Dict[str, Any]] = {}
+        try:
+            prompt = self._create_batch_prompt(papers)
+
+            self.api_calls += 1
+
+            if self.provider == "dashscope":
+                decisions = await self._call_with_retry_async(
+                    lambda: self._call_dashscope_batch(client, prompt, len(papers))
+                )
+            elif self.provider == "azure":
+                decisions = await self._call_with_retry_async(
+                    lambda: self._call_azure_batch(client, prompt, len(papers))
+                )
+            else:
+                raise ValueError(f"Unknown provider: {self.provider}")
+
+        except Exception as e:
+            print(f"  Warning: LLM API error for batch of {len(papers)} papers: {e}")
+
+        results = []
+        for i, (paper, cache_key) in enumerate(zip(papers, cache_keys)):
+            decision = decisions.get(i)
+            if decision is None:
+                results.append(await self._score_paper_async(client, paper, cache_key))
+                continue
+
+            # Save to cache
+            self._save_to_cache(cache_key, decision)
+            results.append(self._decision_to_result(decision, cached=False))
+
+        return results
+
+    async def _score_papers_async(
+        self,
+        papers: List[Any],
+        cache_keys: List[str],
+    ) -> List[Tuple[bool, int, Dict[str, Any]]]:
+        """Score papers concurrently, with at most max_concurrency requests in flight.
+
+        Papers are sent papers_per_request at a time.
+
+        Args:
+            papers: Paper objects that are not in the cache
+            cache_keys: Cache key for each paper
+
+        Returns:
+            Tuple of (is_relevant, score, metadata) for each paper, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        scored = 0
+        size = self.papers_per_request
+
+        async with self._create_async_client() as client:
+
+            async def score_batch(start: int) -> List[Tuple[bool, int, Dict[str, Any]]]:
+                nonlocal scored
+                async with semaphore:
+                    results = await self._score_batch_async(
+                        client, papers[start:start + size], cache_keys[start:start + size]
+                    )
+                previous, scored = scored, scored + len(results)
+                if scored // 10 > previous // 10:
+                    print(f"  Progress: {scored}/{len(papers)} papers scored")
+                return results
+
+            batches = await asyncio.gather(
+                *(score_batch(start) for start in range(0, len(papers), size))
+            )
+
+        return [result for batch in batches for result in batch]
+
+    def _create_batch_api_request(self, cache_key: str, paper: Any) -> Dict[str, Any]:
+        """Build one Batch API input line for a paper.
+
+        Args:
+            cache_key: Cache key for the paper, used as the request's custom_id
+            paper: Paper object with title, abstract, source
+
+        Returns:
+            Batch API request
+        """
+        prompt = self._create_prompt(paper.title, paper.abstract or "", paper.source)
+        return {
+            "custom_id": cache_key,
+            "method": "POST",
+            "url": "/chat/completions",
+            "body": {
+                "model": self.azure_deployment,
+                "messages": self._build_messages(prompt),
+                "temperature": 0.1,
+                "max_tokens": 300,
+                "response_format": {"type": "json_object"},
+            },
+        }
+
+    def _score_papers_offline(
+        self,
+        papers: List[Any],
+        cache_keys: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Score uncached papers with one Batch API job and cache the decisions.
+
+        Uploads the requests as a JSONL file, polls the job until it finishes
+        and reads the decisions from its output file.
+
+        Args:
+            papers: Paper objects that are not in the cache
+            cache_keys: Cache key for each paper
+
+        Returns:
+            Dictionary mapping cache key to decision, for the papers the job scored
+        """
+        requests_by_key = {
+            cache_key: self._create_batch_api_request(cache_key, paper)
+            for paper, cache_key in zip(papers, cache_keys)
+        }
+        batch_input = "\n".join(json.dumps(request) for request in requests_by_key.values())
+
+        batch_file = self.client.files.create(
+            file=("llm_decisions.jsonl", batch_input.encode()),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+        self.api_calls += 1
+        print(f"  Submitted Batch API job {batch.id} with {len(requests_by_key)} requests")
+
+        while batch.status not in BATCH_API_TERMINAL_STATES:
+            time.sleep(self.batch_poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch API job {batch.id} ended with status '{batch.status}'")
+
+        decisions: Dict[str, Dict[str, Any]] = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                decision = json.loads(content)
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+
+            # Incomplete decisions are dropped, so those papers go through
+            # the direct path instead of being cached
+            cache_key = item.get("custom_id")
+            if cache_key in requests_by_key and _is_valid_decision(decision):
+                # Save to cache
+                self._save_to_cache(cache_key, decision)
+                decisions[cache_key] = decision
+
+        return decisions
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts with the configured embedding model.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text, in input order
+        """
+        batch_size = EMBEDDING_BATCH_SIZE.get(self.provider, 10)
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), batch_size):
+            response = self._call_with_retry(
+                lambda: self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=texts[start:start + batch_size],
+                )
+            )
+            # Results carry their input index; order them explicitly
+            data = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in data)
+        return embeddings
+
+    def _prefilter_by_embedding(
+        self,
+        papers: List[Any],
+        cache_keys: List[str],
+    ) -> Tuple[List[Any], List[str], List[str]]:
+        """Keep only the papers most similar to the research interests.
+
+        Embeddings cost a small fraction of a chat completion, so ranking by
+        embedding similarity first spares the LLM the clearly unrelated papers.
+
+        Args:
+            papers: Paper objects that are not in the cache
+            cache_keys: Cache key for each paper
+
+        Returns:
+            Tuple of (kept papers, their cache keys, cache keys of dropped papers)
+        """
+        if self._interest_embedding is None:
+            self._interest_embedding = self._embed([self.research_interests])[0]
+
+        texts = [
+            f"{paper.title}\n{_truncate_abstract(paper.abstract or '')}" for paper in papers
+        ]
+        similarities = [
+            _cosine_similarity(embedding, self._interest_embedding)
+            for embedding in self._embed(texts)
+        ]
+
+        ranked = sorted(range(len(papers)), key=similarities.__getitem__, reverse=True)
+        kept = sorted(ranked[:self.prefilter_top_k])
+        dropped = ranked[self.prefilter_top_k:]
+
+        return (
+            [papers[i] for i in kept],
+            [cache_keys[i] for i in kept],
+            [cache_keys[i] for i in dropped],
+        )
+
     def score_papers_batch(
         self,
         papers: List[Any],
@@ -316,26 +1199,123 @@ Only respond with the JSON object, no additional text."""
         Returns:
             Filtered list of papers with LLM scores
         """
-        filtered_papers = []
+        groups = self.score_papers_grouped(papers, min_score=min_score)
+        return groups["high"] + groups["medium"] + groups["low"]
+
+    def score_papers_grouped(
+        self,
+        papers: List[Any],
+        min_score: int = 50,
+    ) -> Dict[str, List[Any]]:
+        """Score multiple papers, filter by minimum score and group by relevance.
 
+        Args:
+            papers: List of Paper objects
+            min_score: Minimum score to include (0-100)
+
+        Returns:
+            Dictionary with 'high', 'medium', 'low' relevance groups, each
+            sorted by LLM score (highest first)
+        """
         print(f"Scoring {len(papers)} papers with LLM ({self.model} via {self.provider})...")
         print(f"Cache location: {self.cache_dir}")
 
-        for i, paper in enumerate(papers, 1):
-            if i % 10 == 0:
-                print(f"  Progress: {i}/{len(papers)} papers scored")
+        # The same paper can arrive from several sources; look up and score
+        # each distinct (title, abstract) once and share the result
+        cache_keys = [self._get_cache_key(paper.title, paper.abstract or "") for paper in papers]
+        unique_papers: Dict[str, Any] = {}
+        for paper, cache_key in zip(papers, cache_keys):
+            unique_papers.setdefault(cache_key, paper)
+
+        # Cache hits are resolved directly; misses are sent to the LLM
+        # concurrently, since each request mostly waits on the network
+        results: Dict[str, Tuple[bool, int, Dict[str, Any]]] = {}
+        miss_papers: List[Any] = []
+        miss_keys: List[str] = []
+
+        for cache_key, paper in unique_papers.items():
+            cached = self._load_from_cache(cache_key)
+            if cached:
+                results[cache_key] = self._decision_to_result(cached, cached=True)
+            else:
+                self.cache_misses += 1
+                miss_papers.append(paper)
+                miss_keys.append(cache_key)
+
+        if self.embedding_model and 0 < self.prefilter_top_k < len(miss_keys):
+            try:
+                miss_papers, miss_keys, dropped_keys = self._prefilter_by_embedding(
+                    miss_papers, miss_keys
+                )
+                print(
+                    f"  Embedding prefilter kept {len(miss_keys)} of "
+                    f"{len(miss_keys) + len(dropped_keys)} uncached papers"
+                )
+                # Not judged by the LLM, so not cached either
+                for cache_key in dropped_keys:
+                    results[cache_key] = (False, 0, {"prefiltered": True, "cached": False})
+            except Exception as e:
+                print(f"  Warning: Embedding prefilter failed, scoring all papers: {e}")
+
+        if miss_keys and self.use_batch_api:
+            if self.provider == "azure":
+                try:
+                    decisions = self._score_papers_offline(miss_papers, miss_keys)
+                except Exception as e:
+                    print(f"  Warning: Batch API scoring failed: {e}")
+                    decisions = {}
+
+                for cache_key, decision in decisions.items():
+                    results[cache_key] = self._decision_to_result(decision, cached=False)
+
+                # Anything the job did not score goes through the direct path
+                remaining = [
+                    (paper, cache_key)
+                    for paper, cache_key in zip(miss_papers, miss_keys)
+                    if cache_key not in decisions
+                ]
+                miss_papers = [paper for paper, _ in remaining]
+                miss_keys = [cache_key for _, cache_key in remaining]
+            else:
+                print(f"  Note: {self.provider} has no Batch API, scoring papers directly")
+
+        if miss_keys:
+            print(
+                f"  Requesting {len(miss_keys)} uncached papers "
+                f"({self.papers_per_request} per request, "
+                f"up to {self.max_concurrency} requests at a time)"
+            )
+            scored = asyncio.run(self._score_papers_async(miss_papers, miss_keys))
+            results.update(zip(miss_keys, scored))
+
+        self.flush_cache()
+
+        # Group while filtering, so callers need no second pass; the groups
+        # cover disjoint score ranges, so each is sorted on its own
+        groups: Dict[str, List[Any]] = {
+            "high": [],
+            "medium": [],
+            "low": [],
+        }
 
-            relevant, score, metadata = self.score_paper(paper)
+        for paper, cache_key in zip(papers, cache_keys):
+            relevant, score, metadata = results[cache_key]
 
             if score >= min_score:
                 # Store LLM metadata in paper
                 paper.relevance_score = score
                 paper.llm_metadata = metadata
                 paper.matched_keywords = metadata.get("topics", [])
-                filtered_papers.append(paper)
+                if score >= HIGH_RELEVANCE_SCORE:
+                    groups["high"].append(paper)
+                elif score >= MEDIUM_RELEVANCE_SCORE:
+                    groups["medium"].append(paper)
+                else:
+                    groups["low"].append(paper)
 
         # Sort by relevance score (highest first)
-        filtered_papers.sort(key=lambda p: p.relevance_score, reverse=True)
+        for group in groups.values():
+            group.sort(key=lambda p: p.relevance_score, reverse=True)
 
         print(f"\nLLM Scoring Statistics:")
         print(f"  API calls: {self.api_calls}")
@@ -344,7 +1324,7 @@ Only respond with the JSON object, no additional text."""
         if self.cache_hits + self.cache_misses > 0:
             print(f"  Cache hit rate: {self.cache_hits / (self.cache_hits + self.cache_misses) * 100:.1f}%")
 
-        return filtered_papers
+        return groups
 
     def group_papers_by_relevance(
         self,
@@ -367,9 +1347,9 @@ Only respond with the JSON object, no additional text."""
         for paper in papers:
             score = paper.relevance_score
 
-            if score >= 75:
+            if score >= HIGH_RELEVANCE_SCORE:
                 groups["high"].append(paper)
-            elif score >= 50:
+            elif score >= MEDIUM_RELEVANCE_SCORE:
                 groups["medium"].append(paper)
             else:
                 groups["low"].append(paper)
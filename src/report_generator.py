@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Union
 
 
 class MarkdownReportGenerator:
@@ -32,14 +32,14 @@ class MarkdownReportGenerator:
         else:
             return f"{', '.join(authors[:max_authors])}, et al."
 
-    def _format_paper(self, paper: Any) -> str:
-        """Format a single paper as markdown.
+    def _format_paper_iter(self, paper: Any) -> Iterator[str]:
+        """Format a single paper as markdown, one fragment at a time.
 
         Args:
             paper: Paper object with metadata
 
-        Returns:
-            Markdown formatted paper entry
+        Yields:
+            Fragments of the markdown formatted paper entry
         """
         # Format date
         pub_date = paper.published.strftime("%Y-%m-%d")
@@ -48,58 +48,54 @@ class MarkdownReportGenerator:
         keywords_str = ", ".join(paper.matched_keywords)
 
         # Build markdown
-        md = f"### {paper.title}\n\n"
-        md += f"**Source:** {paper.source}\n\n"
-        md += f"**Authors:** {self._format_authors(paper.authors)}\n\n"
-        md += f"**Published:** {pub_date}\n\n"
-        md += f"**Relevance Score:** {paper.relevance_score}\n\n"
+        yield f"### {paper.title}\n\n"
+        yield f"**Source:** {paper.source}\n\n"
+        yield f"**Authors:** {self._format_authors(paper.authors)}\n\n"
+        yield f"**Published:** {pub_date}\n\n"
+        yield f"**Relevance Score:** {paper.relevance_score}\n\n"
 
         # Show LLM metadata if available
         if hasattr(paper, 'llm_metadata') and paper.llm_metadata:
-            md += f"**LLM Confidence:** {paper.llm_metadata.get('confidence', 'N/A')}\n\n"
+            yield f"**LLM Confidence:** {paper.llm_metadata.get('confidence', 'N/A')}\n\n"
             if paper.llm_metadata.get('reasoning'):
-                md += f"**LLM Reasoning:** {paper.llm_metadata['reasoning']}\n\n"
+                yield f"**LLM Reasoning:** {paper.llm_metadata['reasoning']}\n\n"
             if paper.llm_metadata.get('topics'):
                 topics_str = ", ".join(paper.llm_metadata['topics'])
-                md += f"**Relevant Topics:** {topics_str}\n\n"
+                yield f"**Relevant Topics:** {topics_str}\n\n"
         else:
-            md += f"**Matched Keywords:** {keywords_str}\n\n"
+            yield f"**Matched Keywords:** {keywords_str}\n\n"
 
         if hasattr(paper, 'doi') and paper.doi:
-            md += f"**DOI:** {paper.doi}\n\n"
-        md += f"**Link:** {paper.url}\n\n"
+            yield f"**DOI:** {paper.doi}\n\n"
+        yield f"**Link:** {paper.url}\n\n"
         if paper.abstract:
-            md += f"**Abstract:**\n\n{paper.abstract}\n\n"
-        md += "---\n\n"
-
-        return md
+            yield f"**Abstract:**\n\n{paper.abstract}\n\n"
+        yield "---\n\n"
 
-    def _format_group(
+    def _format_group_iter(
         self,
         papers: List[Any],
         group_name: str,
         group_description: str,
-    ) -> str:
-        """Format a group of papers.
+    ) -> Iterator[str]:
+        """Format a group of papers, one fragment at a time.
 
         Args:
             papers: List of papers
             group_name: Name of the group
             group_description: Description of the group
 
-        Returns:
-            Markdown formatted group section
+        Yields:
+            Fragments of the markdown formatted group section
         """
         if not papers:
-            return ""
+            return
 
-        md = f"## {group_name} ({len(papers)} papers)\n\n"
-        md += f"_{group_description}_\n\n"
+        yield f"## {group_name} ({len(papers)} papers)\n\n"
+        yield f"_{group_description}_\n\n"
 
         for paper in papers:
-            md += self._format_paper(paper)
-
-        return md
+            yield from self._format_paper_iter(paper)
 
     def generate_report(
         self,
@@ -119,48 +115,52 @@ class MarkdownReportGenerator:
         Returns:
             Path to generated report file
         """
-        # Generate timestamp for filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock reading for the filename and the header, so they always agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"research_papers_{timestamp}.md"
         filepath = self.output_dir / filename
 
-        # Build report header
-        report = "# Research Paper Weekly Feed\n\n"
-        report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        report += f"**Time Range:** Last {days} days\n\n"
-        report += f"**Sources:** {', '.join(sorted(sources))}\n\n"
-        report += f"**Total Papers Found:** {len(papers)}\n\n"
-        report += "---\n\n"
-
-        # Add summary statistics
-        report += "## Summary\n\n"
-        report += f"- **High Relevance:** {len(grouped_papers['high'])} papers\n"
-        report += f"- **Medium Relevance:** {len(grouped_papers['medium'])} papers\n"
-        report += f"- **Low Relevance:** {len(grouped_papers['low'])} papers\n\n"
-        report += "---\n\n"
-
-        # Add grouped papers
-        report += self._format_group(
-            grouped_papers["high"],
-            "High Relevance Papers",
-            "Papers with strong matches to primary research keywords (score ≥ 20)",
-        )
-
-        report += self._format_group(
-            grouped_papers["medium"],
-            "Medium Relevance Papers",
-            "Papers with moderate matches to research keywords (score 10-19)",
-        )
-
-        report += self._format_group(
-            grouped_papers["low"],
-            "Low Relevance Papers",
-            "Papers with some matches to research keywords (score 1-9)",
-        )
-
-        # Write to file
+        # Stream fragments straight to the file, so memory use stays at one
+        # fragment no matter how many papers and abstracts the report holds
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report)
+            # Report header
+            f.write(
+                "# Research Paper Weekly Feed\n\n"
+                f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"**Time Range:** Last {days} days\n\n"
+                f"**Sources:** {', '.join(sorted(sources))}\n\n"
+                f"**Total Papers Found:** {len(papers)}\n\n"
+                "---\n\n"
+            )
+
+            # Summary statistics
+            f.write(
+                "## Summary\n\n"
+                f"- **High Relevance:** {len(grouped_papers['high'])} papers\n"
+                f"- **Medium Relevance:** {len(grouped_papers['medium'])} papers\n"
+                f"- **Low Relevance:** {len(grouped_papers['low'])} papers\n\n"
+                "---\n\n"
+            )
+
+            # Grouped papers
+            f.writelines(self._format_group_iter(
+                grouped_papers["high"],
+                "High Relevance Papers",
+                "Papers with strong matches to primary research keywords (score ≥ 20)",
+            ))
+
+            f.writelines(self._format_group_iter(
+                grouped_papers["medium"],
+                "Medium Relevance Papers",
+                "Papers with moderate matches to research keywords (score 10-19)",
+            ))
+
+            f.writelines(self._format_group_iter(
+                grouped_papers["low"],
+                "Low Relevance Papers",
+                "Papers with some matches to research keywords (score 1-9)",
+            ))
 
         return str(filepath)
 
@@ -180,30 +180,33 @@ class MarkdownReportGenerator:
         Returns:
             Path to generated summary report file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"research_summary_{timestamp}.md"
         filepath = self.output_dir / filename
 
-        report = "# Research Paper Summary\n\n"
-        report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        report += f"**Time Range:** Last {days} days\n\n"
-        report += f"**Total Papers:** {len(papers)}\n\n"
-        report += "---\n\n"
-
-        for group_name, group_papers in [
-            ("High Relevance", grouped_papers["high"]),
-            ("Medium Relevance", grouped_papers["medium"]),
-            ("Low Relevance", grouped_papers["low"]),
-        ]:
-            if group_papers:
-                report += f"## {group_name} ({len(group_papers)} papers)\n\n"
-                for paper in group_papers:
-                    report += f"- **{paper.title}**\n"
-                    report += f"  - Score: {paper.relevance_score}\n"
-                    report += f"  - Keywords: {', '.join(paper.matched_keywords)}\n"
-                    report += f"  - Link: {paper.url}\n\n"
-
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report)
+            f.write(
+                "# Research Paper Summary\n\n"
+                f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                f"**Time Range:** Last {days} days\n\n"
+                f"**Total Papers:** {len(papers)}\n\n"
+                "---\n\n"
+            )
+
+            for group_name, group_papers in [
+                ("High Relevance", grouped_papers["high"]),
+                ("Medium Relevance", grouped_papers["medium"]),
+                ("Low Relevance", grouped_papers["low"]),
+            ]:
+                if group_papers:
+                    f.write(f"## {group_name} ({len(group_papers)} papers)\n\n")
+                    for paper in group_papers:
+                        f.write(
+                            f"- **{paper.title}**\n"
+                            f"  - Score: {paper.relevance_score}\n"
+                            f"  - Keywords: {', '.join(paper.matched_keywords)}\n"
+                            f"  - Link: {paper.url}\n\n"
+                        )
 
         return str(filepath)